@@ -1,62 +1,297 @@
+from __future__ import annotations
+
 import asyncio
-from typing import Any, Dict, Iterable, Type, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Literal,
+    Tuple,
+    Union,
+    overload,
+)
 
-import pandas as pd
+from pyhoo.cache import ResponseCache
+from pyhoo.chart_cache import ChartRangeCache
+from pyhoo.client import AsyncClient, Client, iterate_in_loop
+from pyhoo.concurrency import AdaptiveConcurrency, Concurrency
+from pyhoo.decoder import JsonDecoder
+from pyhoo.output import Output
+from pyhoo.rate_limiter import FileTokenBucket, RateLimiter, TokenBucket
+from pyhoo.results import NormalizedResult, PartialResult, TickerFailure
+from pyhoo.retry import RetryPolicy
+from pyhoo.schema import Dtypes
+from pyhoo.sink import DatasetSink, Manifest, WrittenFile
+from pyhoo.types import Endpoint
 
-from pyhoo.config import endpoints_config
-from pyhoo.errors import ApiError
-from pyhoo.parsers.abc import BaseParser
-from pyhoo.requester import Requester
-from pyhoo.types import ApiResponse, Endpoint, ErrorDescription
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
 
 
+@overload
 def get(
     endpoint: Endpoint,
     tickers: Union[str, Iterable[str]],
-    max_concurrent_calls: int = 100,
-    ignore_errors: bool = False,
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[False] = ...,
+    output: Literal["pandas"] = ...,
+    normalize: Literal[False] = ...,
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
     **params: Any,
 ) -> pd.DataFrame:
-    if not _is_iterable(tickers):
-        tickers = [cast(str, tickers)]
-    endpoint_config = endpoints_config[endpoint]
-    endpoint_config.validate(params)
-    responses = asyncio.run(
-        Requester(
-            path=endpoint_config.path,
-            tickers=tickers,
-            max_concurrent_calls=max_concurrent_calls,
-            **endpoint_config.format(params),
-        ).request()
-    )
-    return _convert_to_dataframe(
-        responses=responses,
-        response_field=endpoint_config.response_field,
-        parser=endpoint_config.parser,
-        ignore_errors=ignore_errors,
-    )
+    ...
 
 
-def _is_iterable(obj: Any) -> bool:
-    """Check that an object is iterable but not a string (strings are iterable)."""
-    return hasattr(obj, "__iter__") and not isinstance(obj, str)
+@overload
+def get(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[False] = ...,
+    output: Literal["numpy", "arrow"],
+    normalize: Literal[False] = ...,
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
+) -> Any:
+    ...
 
 
-def _convert_to_dataframe(
-    responses: Iterable[Dict[str, ApiResponse]],
-    response_field: str,
-    parser: Type[BaseParser],
-    ignore_errors: bool,
+@overload
+def get(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[False] = ...,
+    output: Output = ...,
+    normalize: Literal[True],
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
+) -> NormalizedResult:
+    ...
+
+
+@overload
+def get(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[True],
+    output: Output = ...,
+    normalize: bool = ...,
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
+) -> PartialResult:
+    ...
+
+
+def get(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = 100,
+    ignore_errors: bool = False,
+    *,
+    partial: bool = False,
+    output: Output = "pandas",
+    normalize: bool = False,
+    dtypes: Dtypes = "inferred",
+    wide: bool = False,
+    json_decoder: JsonDecoder = "auto",
+    **params: Any,
+) -> Any:
+    return asyncio.run(
+        aget(  # type: ignore
+            endpoint,
+            tickers,
+            max_concurrent_calls,
+            ignore_errors,
+            partial=partial,
+            output=output,
+            normalize=normalize,
+            dtypes=dtypes,
+            wide=wide,
+            json_decoder=json_decoder,
+            **params,
+        )
+    )
+
+
+@overload
+async def aget(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[False] = ...,
+    output: Literal["pandas"] = ...,
+    normalize: Literal[False] = ...,
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
 ) -> pd.DataFrame:
-    records = []
-    for response in responses:
-        response_data = response[response_field]
-        if response_data.get("error") is not None:
-            if ignore_errors:
-                continue
-            error = cast(ErrorDescription, response_data["error"])
-            raise ApiError(error["code"], error["description"])
-        result = response_data["result"]
-        if result is not None:
-            records += [record for data in result for record in parser(**data).to_records()]
-    return pd.DataFrame(records)
+    ...
+
+
+@overload
+async def aget(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[False] = ...,
+    output: Literal["numpy", "arrow"],
+    normalize: Literal[False] = ...,
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
+) -> Any:
+    ...
+
+
+@overload
+async def aget(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[False] = ...,
+    output: Output = ...,
+    normalize: Literal[True],
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
+) -> NormalizedResult:
+    ...
+
+
+@overload
+async def aget(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = ...,
+    ignore_errors: bool = ...,
+    *,
+    partial: Literal[True],
+    output: Output = ...,
+    normalize: bool = ...,
+    dtypes: Dtypes = ...,
+    wide: bool = ...,
+    json_decoder: JsonDecoder = ...,
+    **params: Any,
+) -> PartialResult:
+    ...
+
+
+async def aget(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = 100,
+    ignore_errors: bool = False,
+    *,
+    partial: bool = False,
+    output: Output = "pandas",
+    normalize: bool = False,
+    dtypes: Dtypes = "inferred",
+    wide: bool = False,
+    json_decoder: JsonDecoder = "auto",
+    **params: Any,
+) -> Any:
+    """Coroutine version of `get`, to be awaited from a running event loop (Jupyter, web servers...).
+    To share one session and concurrency budget between many calls, use an `AsyncClient` instead.
+    """
+    async with AsyncClient(max_concurrent_calls=max_concurrent_calls, json_decoder=json_decoder) as client:
+        return await client.get(  # type: ignore
+            endpoint,
+            tickers,
+            ignore_errors,
+            partial=partial,
+            output=output,
+            normalize=normalize,
+            dtypes=dtypes,
+            wide=wide,
+            **params,
+        )
+
+
+def stream(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = 100,
+    ignore_errors: bool = False,
+    *,
+    json_decoder: JsonDecoder = "auto",
+    **params: Any,
+) -> Generator[Tuple[str, pd.DataFrame], None, None]:
+    """Yield `(ticker, frame)` pairs as soon as each ticker is fetched and parsed, in completion order."""
+    loop = asyncio.new_event_loop()
+    try:
+        iterator = astream(endpoint, tickers, max_concurrent_calls, ignore_errors, json_decoder=json_decoder, **params)
+        yield from iterate_in_loop(loop, iterator)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+async def astream(
+    endpoint: Endpoint,
+    tickers: Union[str, Iterable[str]],
+    max_concurrent_calls: Concurrency = 100,
+    ignore_errors: bool = False,
+    *,
+    json_decoder: JsonDecoder = "auto",
+    **params: Any,
+) -> AsyncIterator[Tuple[str, pd.DataFrame]]:
+    """Asynchronous iterator version of `stream`."""
+    async with AsyncClient(max_concurrent_calls=max_concurrent_calls, json_decoder=json_decoder) as client:
+        items = client.stream(endpoint, tickers, ignore_errors=ignore_errors, **params)
+        try:
+            async for item in items:
+                yield item
+        finally:
+            await items.aclose()
+
+
+__all__ = [
+    "AdaptiveConcurrency",
+    "AsyncClient",
+    "ChartRangeCache",
+    "Client",
+    "DatasetSink",
+    "FileTokenBucket",
+    "Manifest",
+    "NormalizedResult",
+    "PartialResult",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "TickerFailure",
+    "TokenBucket",
+    "WrittenFile",
+    "aget",
+    "astream",
+    "get",
+    "stream",
+]
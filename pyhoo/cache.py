@@ -0,0 +1,139 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+from pyhoo.config import endpoints_config
+from pyhoo.models.chart import Interval
+
+DEFAULT_TTL = {
+    "chart": 15 * 60,
+    "fundamentals": 24 * 60 * 60,
+    "options": 5 * 60,
+}
+
+
+class ResponseCache:
+    """Persistent cache of API responses, stored compressed in a SQLite database.
+
+    Entries are keyed on the normalized URL (path, ticker and sorted parameters) and expire after
+    the time to live of their endpoint, in seconds. Unless given a `chart` time to live, `chart` entries
+    expire after one bar of their interval instead, e.g. one minute for `1m` bars and one day for `1d` bars.
+    When the database grows over `max_bytes`, expired entries are dropped first, then the least recently used ones.
+
+    Several processes can share the same database. `hits` and `misses` count the lookups of this instance,
+    from any thread.
+    """
+
+    path: Path
+    max_bytes: int
+    compression_level: int
+    hits: int
+    misses: int
+    _ttl: Dict[str, float]
+    _default_ttl: float
+    _ttl_by_interval: bool
+    _counts_lock: threading.Lock
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        ttl: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 60 * 60,
+        max_bytes: int = 512 * 1024 * 1024,
+        compression_level: int = 6,
+    ) -> None:
+        """`ttl` maps endpoint names (`chart`, `fundamentals`, `options`) to their time to live."""
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.hits = 0
+        self.misses = 0
+        endpoints_ttl = {**DEFAULT_TTL, **(ttl or {})}
+        self._ttl = {endpoints_config[endpoint].path: value for endpoint, value in endpoints_ttl.items()}
+        self._default_ttl = default_ttl
+        self._ttl_by_interval = "chart" not in (ttl or {})
+        self._counts_lock = threading.Lock()
+        with closing(self._connect()) as connection, connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    @staticmethod
+    def key(path: str, ticker: str, params: Mapping[str, Any]) -> str:
+        query = "&".join(f"{name}={value}" for name, value in sorted(params.items()))
+        return f"{path}/{ticker}?{query}"
+
+    def get(self, path: str, ticker: str, params: Mapping[str, Any]) -> Optional[Any]:
+        """Decoded response, or `None` if missing or expired."""
+        key = self.key(path, ticker, params)
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is not None:
+                connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        with self._counts_lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if row is None:
+            return None
+        return json.loads(zlib.decompress(row[0]))
+
+    def set(self, path: str, ticker: str, params: Mapping[str, Any], data: Any) -> None:
+        value = zlib.compress(json.dumps(data).encode(), self.compression_level)
+        now = time.time()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (self.key(path, ticker, params), value, len(value), now + self.ttl(path, params), now),
+            )
+            self._evict(connection, now)
+
+    def ttl(self, path: str, params: Mapping[str, Any]) -> float:
+        """Time to live of the response to a request, in seconds.
+        Intraday charts, and charts ending in the past, expire after one bar: a daily chart still open
+        gets the chart time to live instead, not to serve its last bar stale for a whole day.
+        """
+        if self._ttl_by_interval and path == endpoints_config["chart"].path and "interval" in params:
+            interval = Interval(params["interval"])
+            if interval.intraday or float(params.get("period2", float("inf"))) < time.time():
+                return interval.seconds
+        return self._ttl.get(path, self._default_ttl)
+
+    def clear(self) -> None:
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, int]:
+        with closing(self._connect()) as connection:
+            entries, size = connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> None:
+        (size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if size <= self.max_bytes:
+            return
+        connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        (size,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        for key, entry_size in connection.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall():
+            if size <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            size -= entry_size
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per operation, so that the cache can be used from executor threads and forked processes
+        return sqlite3.connect(self.path, timeout=30.0)
@@ -0,0 +1,167 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote
+
+import numpy as np
+
+from pyhoo.columns import concatenate, deduplicate, length, take
+from pyhoo.models.chart import Interval
+from pyhoo.types import Columns
+
+# Half-open range of timestamps `[start, end)`, in seconds since epoch
+Period = Tuple[int, int]
+
+_PERIODS_KEY = "__periods__"
+
+# Prefix of the masks of the missing values of the string columns
+_MISSING_PREFIX = "__missing__"
+
+
+def merge_periods(periods: Iterable[Period]) -> List[Period]:
+    """Sort periods and merge the overlapping or contiguous ones."""
+    merged: List[Period] = []
+    for start, end in sorted(period for period in periods if period[0] < period[1]):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def missing_periods(covered: Iterable[Period], start: int, end: int) -> List[Period]:
+    """Parts of `[start, end)` not covered by any of the `covered` periods."""
+    missing: List[Period] = []
+    cursor = start
+    for covered_start, covered_end in merge_periods(covered):
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+def bars_within(bars: Columns, start: int, end: int) -> Columns:
+    """Bars within `[start, end)`."""
+    if not length(bars):
+        return bars
+    return take(bars, (bars["timestamp"] >= start) & (bars["timestamp"] < end))
+
+
+class ChartRangeCache:
+    """Bars of the `chart` endpoint stored on disk, one file per (symbol, granularity),
+    along with the periods already fetched, so that only the missing parts of a period are requested.
+
+    The last bar fetched may still be forming: a period is only marked as covered up to one bar before
+    the time it was fetched. Files are replaced atomically, so several processes can share a directory,
+    at worst fetching the same period twice.
+    String columns are stored as fixed width unicode arrays, so that files are loaded without unpickling,
+    and a tampered file cannot run code.
+    """
+
+    directory: Path
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+
+    def missing(self, symbol: str, granularity: str, start: int, end: int) -> List[Period]:
+        """Parts of `[start, end)` to fetch."""
+        _, periods = self.load(symbol, granularity)
+        return missing_periods(periods, start, end)
+
+    def read(self, symbol: str, granularity: str, start: int, end: int) -> Columns:
+        """Stored bars within `[start, end)`."""
+        bars, _ = self.load(symbol, granularity)
+        return bars_within(bars, start, end)
+
+    def last_timestamp(self, symbol: str, granularity: str) -> Optional[int]:
+        """Timestamp of the last stored bar, `None` when no bar is stored yet."""
+        bars, _ = self.load(symbol, granularity)
+        if not length(bars):
+            return None
+        return int(bars["timestamp"].max())
+
+    def update(
+        self,
+        symbol: str,
+        granularity: str,
+        bars: Columns,
+        periods: Iterable[Period],
+        stored: Optional[Tuple[Columns, List[Period]]] = None,
+    ) -> Columns:
+        """Merge newly fetched `bars` with the stored ones, newer bars replacing older ones,
+        and mark the `periods` they were fetched for as covered. Return every stored bar.
+        `stored` is what `load` returned before fetching, so that the file is not loaded again.
+        """
+        covered_until = int(time.time()) - Interval(granularity).seconds
+        periods = [(start, min(end, covered_until)) for start, end in periods]
+        stored_bars, stored_periods = self.load(symbol, granularity) if stored is None else stored
+        merged = deduplicate(concatenate([stored_bars, bars]), ["timestamp"])
+        self._save(symbol, granularity, merged, merge_periods([*stored_periods, *periods]))
+        return merged
+
+    def load(self, symbol: str, granularity: str) -> Tuple[Columns, List[Period]]:
+        """Stored bars and the periods they cover."""
+        path = self._path(symbol, granularity)
+        if not path.exists():
+            return {}, []
+        try:
+            with np.load(path, allow_pickle=False) as file:
+                arrays = {key: file[key] for key in file.files}
+        except ValueError:
+            # Files holding pickled columns are not trusted, their bars are fetched again
+            return {}, []
+        periods = [(int(start), int(end)) for start, end in arrays.pop(_PERIODS_KEY)]
+        return _decode_strings(arrays), periods
+
+    def _save(self, symbol: str, granularity: str, bars: Columns, periods: List[Period]) -> None:
+        path = self._path(symbol, granularity)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {**_encode_strings(bars), _PERIODS_KEY: np.array(periods, dtype=np.int64).reshape(-1, 2)}
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                np.savez_compressed(file, **arrays)
+            os.replace(temporary_path, path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+    def _path(self, symbol: str, granularity: str) -> Path:
+        return self.directory / granularity / f"{quote(symbol, safe='')}.npz"
+
+
+def _encode_strings(bars: Columns) -> Columns:
+    """Store the `object` columns, made of strings and `None`, as unicode arrays along with their missing values."""
+    arrays: Columns = {}
+    for name, values in bars.items():
+        if values.dtype != object:
+            arrays[name] = values
+            continue
+        missing = np.array([value is None for value in values.tolist()], dtype=bool)
+        arrays[name] = np.where(missing, "", values).astype(str)
+        if missing.any():
+            arrays[_MISSING_PREFIX + name] = missing
+    return arrays
+
+
+def _decode_strings(arrays: Columns) -> Columns:
+    """Inverse of `_encode_strings`, giving back `object` columns."""
+    bars: Columns = {}
+    for name, values in arrays.items():
+        if name.startswith(_MISSING_PREFIX):
+            continue
+        if values.dtype.kind == "U":
+            values = values.astype(object)
+            missing = arrays.get(_MISSING_PREFIX + name)
+            if missing is not None:
+                values[missing] = None
+        bars[name] = values
+    return bars
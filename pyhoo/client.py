@@ -0,0 +1,871 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+import time
+from collections import defaultdict
+from concurrent.futures import Executor
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
+
+import aiohttp
+
+from pyhoo.cache import ResponseCache
+from pyhoo.chart_cache import (
+    ChartRangeCache,
+    Period,
+    bars_within,
+    missing_periods,
+)
+from pyhoo.columns import concatenate, length
+from pyhoo.concurrency import AdaptiveConcurrency, Concurrency
+from pyhoo.config import Config, endpoints_config, str_date_to_timestamp
+from pyhoo.converter import (
+    convert_to_output,
+    convert_to_partial_result,
+    convert_to_tables,
+    is_iterable,
+    response_parser,
+    split_tables,
+)
+from pyhoo.decoder import Decoder, JsonDecoder, get_decoder
+from pyhoo.errors import InvalidParameterValueError, MissingParameterError
+from pyhoo.getter import GetTickerDataTask
+from pyhoo.output import Output, to_frame, validate_output
+from pyhoo.rate_limiter import RateLimiter
+from pyhoo.requester import Query, Requester
+from pyhoo.results import NormalizedResult, PartialResult, TickerFailure
+from pyhoo.retry import RetryPolicy
+from pyhoo.schema import Dtypes
+from pyhoo.sink import DatasetSink, Manifest
+from pyhoo.types import ApiResponse, Columns, Endpoint, Tables
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+
+class AsyncClient:
+    """Long-lived asynchronous client owning one `aiohttp` session, running on the caller's event loop.
+    Concurrent `get` calls share the session connection pool, hence the `max_concurrent_calls` budget.
+    An `AdaptiveConcurrency` can be given as `max_concurrent_calls`, to adjust the budget to the server response.
+
+    Ex:
+        async with pyhoo.AsyncClient(max_concurrent_calls=50) as client:
+            prices, options = await asyncio.gather(
+                client.get("chart", tickers, start="2020-01-01", end="2020-12-31"),
+                client.get("options", tickers),
+            )
+    """
+
+    _max_concurrent_calls: int
+    _concurrency: Optional[AdaptiveConcurrency]
+    _keepalive_timeout: float
+    _retry_policy: RetryPolicy
+    _rate_limiter: Optional[RateLimiter]
+    _cache: Optional[ResponseCache]
+    _chart_cache: Optional[ChartRangeCache]
+    _decoder: Decoder
+    _parse_executor: Optional[Executor]
+    _session: Optional[aiohttp.ClientSession]
+
+    def __init__(
+        self,
+        max_concurrent_calls: Concurrency = 100,
+        keepalive_timeout: float = 60.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        chart_cache: Optional[ChartRangeCache] = None,
+        json_decoder: JsonDecoder = "auto",
+        parse_executor: Optional[Executor] = None,
+    ) -> None:
+        """`retry_policy` defaults to `RetryPolicy()`, pass `RetryPolicy(max_attempts=1)` to disable retries.
+        A `rate_limiter` can be shared between clients to enforce a global requests per second budget.
+        With a `cache`, responses are read from and saved to disk instead of always going over the network.
+        With a `chart_cache`, `chart` bars are stored on disk and only the periods not fetched yet are requested.
+        `json_decoder` is one of "orjson", "simdjson" or "json", "auto" picking the fastest one installed,
+        or any function decoding bytes.
+        Responses are parsed as soon as they are received, in the event loop thread by default,
+        or in the workers of `parse_executor`, e.g. a `ProcessPoolExecutor` for large universes.
+        """
+        if isinstance(max_concurrent_calls, AdaptiveConcurrency):
+            self._max_concurrent_calls = max_concurrent_calls.max_window
+            self._concurrency = max_concurrent_calls
+        else:
+            self._max_concurrent_calls = max_concurrent_calls
+            self._concurrency = None
+        self._keepalive_timeout = keepalive_timeout
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._chart_cache = chart_cache
+        self._decoder = get_decoder(json_decoder)
+        self._parse_executor = parse_executor
+        self._session = None
+
+    @overload
+    async def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        output: Literal["pandas"] = ...,
+        normalize: Literal[False] = ...,
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> pd.DataFrame:
+        ...
+
+    @overload
+    async def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        output: Literal["numpy", "arrow"],
+        normalize: Literal[False] = ...,
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> Any:
+        ...
+
+    @overload
+    async def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        output: Output = ...,
+        normalize: Literal[True],
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> NormalizedResult:
+        ...
+
+    @overload
+    async def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[True],
+        output: Output = ...,
+        normalize: bool = ...,
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> PartialResult:
+        ...
+
+    async def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = False,
+        *,
+        partial: bool = False,
+        output: Output = "pandas",
+        normalize: bool = False,
+        dtypes: Dtypes = "inferred",
+        wide: bool = False,
+        **params: Any,
+    ) -> Any:
+        """Get the data of every ticker as one frame.
+        With `partial`, a ticker failing does not discard the others: a `PartialResult` is returned instead,
+        holding the data of the tickers that succeeded and a report of the ones that failed.
+        `output` is either "pandas" for a `DataFrame`, "numpy" for a dict of arrays, or "arrow" for a `pyarrow.Table`.
+        With `normalize`, the meta data repeated on every row, e.g. the currency and exchange of `chart` bars,
+        is returned once per symbol in a separate table, along with the data rows in a `NormalizedResult`.
+        With `dtypes="typed"`, columns get the dtypes of the endpoint schema instead of the ones inferred
+        from the values: categoricals, `datetime64[s]` dates and fixed width numbers, "float32" downcasting floats.
+        With `wide`, `fundamentals` are returned with one row per symbol, date and period type,
+        and one column per type holding its reported values.
+        """
+        validate_output(output)
+        if endpoint == "chart" and self._chart_cache is not None and "range" not in params:
+            chart_cache = self._chart_cache
+            convert = self._converter(endpoints_config[endpoint], output, normalize, dtypes, wide)
+            return await self._get_through_chart_cache(
+                chart_cache, tickers, ignore_errors, partial, normalize, convert, params
+            )
+        requester, split = self._prepare(endpoint, tickers, ignore_errors, params, normalize)
+        convert = self._converter(endpoints_config[endpoint], output, normalize, dtypes, wide, deduplicate=split)
+        if partial:
+            return convert_to_partial_result(await requester.request_settled(session=self._open_session()), convert)
+        return convert(await requester.request(session=self._open_session()))
+
+    async def stream(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = False,
+        **params: Any,
+    ) -> AsyncGenerator[Tuple[str, pd.DataFrame], None]:
+        """Yield `(ticker, frame)` pairs as soon as each ticker is fetched and parsed.
+        Tickers in error are skipped when `ignore_errors` is set.
+        A ticker requested in several windows, e.g. a long intraday `chart` period, is yielded once per window.
+        """
+        requester, _ = self._prepare(endpoint, tickers, ignore_errors, params)
+        parsed = requester.stream(session=self._open_session())
+        try:
+            async for ticker, blocks in parsed:
+                if blocks:
+                    yield ticker, to_frame(concatenate(blocks))
+        finally:
+            # Cancel the requests still in flight when the consumer stops iterating early
+            await parsed.aclose()
+
+    async def sink(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        sink: DatasetSink,
+        ignore_errors: bool = False,
+        **params: Any,
+    ) -> Manifest:
+        """Write the data of every ticker to the partitioned `sink` as responses arrive, instead of building a frame.
+        Return the manifest of the written files.
+        """
+        requester, _ = self._prepare(endpoint, tickers, ignore_errors, params)
+        return await sink.write_all(endpoint, requester.stream(session=self._open_session()))
+
+    @overload
+    def chunks(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        chunk_size: int = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        **params: Any,
+    ) -> AsyncIterator[pd.DataFrame]:
+        ...
+
+    @overload
+    def chunks(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        chunk_size: int = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[True],
+        **params: Any,
+    ) -> AsyncIterator[PartialResult]:
+        ...
+
+    async def chunks(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        chunk_size: int = 100,
+        ignore_errors: bool = False,
+        *,
+        partial: bool = False,
+        **params: Any,
+    ) -> AsyncIterator[Union[pd.DataFrame, PartialResult]]:
+        """Get the data of `chunk_size` tickers at a time, yielding one frame, or `PartialResult`, per chunk.
+        `tickers` is consumed lazily, one chunk after the other, so that memory usage is bounded by the chunk size
+        whatever the number of tickers.
+        """
+        iterator = iter([cast(str, tickers)] if not is_iterable(tickers) else tickers)
+        while True:
+            chunk = list(itertools.islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield await self.get(endpoint, chunk, ignore_errors, partial=partial, **params)  # type: ignore
+
+    @overload
+    async def sync(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: str,
+        granularity: str = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+    ) -> pd.DataFrame:
+        ...
+
+    @overload
+    async def sync(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: str,
+        granularity: str = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[True],
+    ) -> PartialResult:
+        ...
+
+    async def sync(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: str,
+        granularity: str = "1d",
+        ignore_errors: bool = False,
+        *,
+        partial: bool = False,
+    ) -> Union[pd.DataFrame, PartialResult]:
+        """Append to the `chart_cache` of the client the `chart` bars published since the last stored one,
+        and return these new bars. The last stored bar is fetched again and returned too, as it may have been
+        still forming when stored. `start` is only used for the tickers without any stored bar yet.
+        A ticker which failed keeps its stored bars, the next `sync` fetches its missing bars again.
+        """
+        chart_cache = self._chart_cache
+        if chart_cache is None:
+            raise MissingParameterError("chart_cache")
+        tickers = [cast(str, tickers)] if not is_iterable(tickers) else list(tickers)
+        endpoints_config["chart"].validate({"start": start, "end": start, "granularity": granularity})
+        first_timestamp = str_date_to_timestamp(start)
+        now = int(time.time())
+
+        stored = await self._load_chart_cache(chart_cache, granularity, tickers)
+        queries = []
+        for ticker in tickers:
+            stored_bars, _ = stored[ticker]
+            period1 = int(stored_bars["timestamp"].max()) if length(stored_bars) else first_timestamp
+            queries.append(Query(ticker, {"period1": period1, "period2": now}))
+        bars, failures = await self._fetch_into_chart_cache(chart_cache, granularity, queries, ignore_errors, stored)
+
+        blocks = [
+            bars_within(bars[ticker], query.params["period1"], now + 1)
+            for ticker, query in zip(tickers, queries)
+            if ticker not in failures
+        ]
+        if failures and not partial:
+            raise next(iter(failures.values())).exception
+        data = to_frame(concatenate(blocks))
+        return PartialResult(data=data, failures=list(failures.values())) if partial else data
+
+    async def warmup(self, connections: int) -> None:
+        """Open up to `connections` connections to the API ahead of a burst of requests."""
+        session = self._open_session()
+        await asyncio.gather(*(GetTickerDataTask.ping(session) for _ in range(connections)))
+
+    async def close(self) -> None:
+        """Close the session and its connections. A new session is opened if the client is used again."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_through_chart_cache(
+        self,
+        chart_cache: ChartRangeCache,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool,
+        partial: bool,
+        normalize: bool,
+        convert: Callable[[Iterable[List[Any]]], Any],
+        params: Dict[str, Any],
+    ) -> Any:
+        """Request only the periods missing from the cache, then read every bar from it."""
+        tickers = [cast(str, tickers)] if not is_iterable(tickers) else list(tickers)
+        endpoint_config = endpoints_config["chart"]
+        endpoint_config.validate(params)
+        api_params = endpoint_config.format(params)
+        start, end, granularity = api_params["period1"], api_params["period2"], api_params["interval"]
+
+        stored = await self._load_chart_cache(chart_cache, granularity, tickers)
+        queries = [
+            Query(ticker, {"period1": period[0], "period2": period[1]})
+            for ticker in tickers
+            for period in missing_periods(stored[ticker][1], start, end)
+        ]
+        bars, failures = await self._fetch_into_chart_cache(chart_cache, granularity, queries, ignore_errors, stored)
+
+        blocks = [bars_within(bars[ticker], start, end) for ticker in tickers if ticker not in failures]
+        if failures and not partial:
+            raise next(iter(failures.values())).exception
+        parsed: List[Any] = blocks
+        if normalize:
+            parsed = [split_tables(block, endpoint_config.meta_columns, "symbol") for block in blocks]
+        data = convert([parsed])
+        return PartialResult(data=data, failures=list(failures.values())) if partial else data
+
+    async def _load_chart_cache(
+        self, chart_cache: ChartRangeCache, granularity: str, tickers: List[str]
+    ) -> Dict[str, Tuple[Columns, List[Period]]]:
+        """Load the stored bars and periods of every ticker at once, in the default executor."""
+        loop = asyncio.get_running_loop()
+        tickers = list(dict.fromkeys(tickers))
+        loaded = await asyncio.gather(
+            *(loop.run_in_executor(None, chart_cache.load, ticker, granularity) for ticker in tickers)
+        )
+        return dict(zip(tickers, loaded))
+
+    async def _fetch_into_chart_cache(
+        self,
+        chart_cache: ChartRangeCache,
+        granularity: str,
+        queries: List[Query],
+        ignore_errors: bool,
+        stored: Dict[str, Tuple[Columns, List[Period]]],
+    ) -> Tuple[Dict[str, Columns], Dict[str, TickerFailure]]:
+        """Fetch the period of each query, split into windows if too long, and store the bars on top of
+        the `stored` ones. Return every stored bar of each ticker, and the tickers that failed.
+        The bars of a ticker are stored even when some of its periods failed.
+        """
+        endpoint_config = endpoints_config["chart"]
+        loop = asyncio.get_running_loop()
+        queries = [
+            Query(query.ticker, {**query.params, **window})
+            for query in queries
+            for window in endpoint_config.split({**query.params, "interval": granularity})
+        ]
+        parse = self._response_parser(endpoint_config, ignore_errors)
+        requester = self._requester(endpoint_config, queries=queries, parse=parse, interval=granularity)
+        parsed = await requester.request_settled(session=self._open_session())
+
+        fetched: DefaultDict[str, List[Columns]] = defaultdict(list)
+        fetched_periods: DefaultDict[str, List[Period]] = defaultdict(list)
+        failures: Dict[str, TickerFailure] = {}
+        for query, (ticker, blocks) in zip(queries, parsed):
+            if isinstance(blocks, BaseException):
+                failures.setdefault(ticker, TickerFailure(ticker, blocks))
+            else:
+                fetched[ticker] += blocks
+                fetched_periods[ticker].append((query.params["period1"], query.params["period2"]))
+
+        updated = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    None, chart_cache.update, ticker, granularity, concatenate(fetched[ticker]), periods, stored[ticker]
+                )
+                for ticker, periods in fetched_periods.items()
+            )
+        )
+        bars = {ticker: stored_bars for ticker, (stored_bars, _) in stored.items()}
+        bars.update(zip(fetched_periods, updated))
+        return bars, failures
+
+    def _prepare(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool,
+        params: Dict[str, Any],
+        normalize: bool = False,
+    ) -> Tuple[Requester, bool]:
+        """Requester of the parsed column blocks of every ticker,
+        and whether the parameters of each ticker were split into several requests.
+        """
+        if not is_iterable(tickers):
+            tickers = [cast(str, tickers)]
+        endpoint_config = endpoints_config[endpoint]
+        endpoint_config.validate(params)
+        api_params = endpoint_config.format(params)
+        windows = endpoint_config.split(api_params)
+        queries = [Query(ticker, window) for ticker in tickers for window in windows]
+        expand = functools.partial(endpoint_config.expand, api_params) if endpoint_config.expander is not None else None
+        keep = functools.partial(endpoint_config.keep, api_params) if endpoint_config.keeper is not None else None
+        requester = self._requester(
+            endpoint_config,
+            queries=queries,
+            expand=expand,
+            keep=keep,
+            parse=self._response_parser(endpoint_config, ignore_errors, normalize),
+            **endpoint_config.request_params(api_params),
+        )
+        return requester, len(windows) > 1
+
+    def _requester(
+        self,
+        endpoint_config: Config,
+        tickers: Iterable[str] = (),
+        queries: Optional[Iterable[Query]] = None,
+        expand: Optional[Callable[[Dict[str, ApiResponse]], List[Dict[str, Any]]]] = None,
+        keep: Optional[Callable[[Dict[str, ApiResponse]], bool]] = None,
+        parse: Optional[Callable[[Dict[str, ApiResponse]], Awaitable[Any]]] = None,
+        **api_params: Any,
+    ) -> Requester:
+        return Requester(
+            path=endpoint_config.path,
+            tickers=tickers,
+            max_concurrent_calls=self._max_concurrent_calls,
+            retry_policy=self._retry_policy,
+            rate_limiter=self._rate_limiter,
+            concurrency=self._concurrency,
+            cache=self._cache,
+            decoder=self._decoder,
+            queries=queries,
+            expand=expand,
+            keep=keep,
+            parse=parse,
+            **api_params,
+        )
+
+    def _response_parser(
+        self, endpoint_config: Config, ignore_errors: bool, normalize: bool = False
+    ) -> Callable[[Dict[str, ApiResponse]], Awaitable[Union[List[Columns], List[Tables]]]]:
+        return response_parser(
+            endpoint_config.response_field,
+            endpoint_config.parser,
+            ignore_errors,
+            executor=self._parse_executor,
+            normalize=normalize,
+        )
+
+    def _converter(
+        self,
+        endpoint_config: Config,
+        output: Output,
+        normalize: bool,
+        dtypes: Dtypes,
+        wide: bool = False,
+        deduplicate: bool = False,
+    ) -> Callable[[Iterable[List[Any]]], Any]:
+        """Conversion of the parsed responses of every ticker to the requested output.
+        With `deduplicate`, the rows returned by several requests of the same ticker are deduplicated.
+        """
+        schema = endpoint_config.schema.for_dtypes(dtypes)
+        unique_keys = endpoint_config.unique_keys if deduplicate else ()
+        if wide and (normalize or endpoint_config.wide is None):
+            raise InvalidParameterValueError("wide", wide, [False])
+        if not normalize:
+            return functools.partial(
+                convert_to_output,
+                unique_keys=unique_keys,
+                output=output,
+                meta_columns=endpoint_config.meta_columns,
+                schema=schema,
+                wide=endpoint_config.wide if wide else None,
+            )
+        if endpoint_config.meta_key is None:
+            raise InvalidParameterValueError("normalize", normalize, [False])
+        return functools.partial(
+            convert_to_tables,
+            unique_keys=unique_keys,
+            meta_key=endpoint_config.meta_key,
+            output=output,
+            meta_columns=endpoint_config.meta_columns,
+            schema=schema,
+        )
+
+    def _open_session(self) -> aiohttp.ClientSession:
+        """Lazily create the session, so that it is bound to the running event loop."""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self._max_concurrent_calls,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def __aenter__(self) -> AsyncClient:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+class Client:
+    """Long-lived client owning one event loop and one `aiohttp` session.
+    Connections are kept alive between `get` calls, so DNS, TCP and TLS setup are paid only once.
+
+    Not thread safe, use one client per thread, or an `AsyncClient` from asynchronous code.
+
+    Ex:
+        with pyhoo.Client(max_concurrent_calls=50) as client:
+            client.warmup(10)
+            prices = client.get("chart", tickers, start="2020-01-01", end="2020-12-31")
+    """
+
+    _loop: asyncio.AbstractEventLoop
+    _client: AsyncClient
+
+    def __init__(
+        self,
+        max_concurrent_calls: Concurrency = 100,
+        keepalive_timeout: float = 60.0,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        chart_cache: Optional[ChartRangeCache] = None,
+        json_decoder: JsonDecoder = "auto",
+        parse_executor: Optional[Executor] = None,
+    ) -> None:
+        self._loop = asyncio.new_event_loop()
+        self._client = AsyncClient(
+            max_concurrent_calls=max_concurrent_calls,
+            keepalive_timeout=keepalive_timeout,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            chart_cache=chart_cache,
+            json_decoder=json_decoder,
+            parse_executor=parse_executor,
+        )
+
+    @overload
+    def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        output: Literal["pandas"] = ...,
+        normalize: Literal[False] = ...,
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> pd.DataFrame:
+        ...
+
+    @overload
+    def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        output: Literal["numpy", "arrow"],
+        normalize: Literal[False] = ...,
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> Any:
+        ...
+
+    @overload
+    def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        output: Output = ...,
+        normalize: Literal[True],
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> NormalizedResult:
+        ...
+
+    @overload
+    def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[True],
+        output: Output = ...,
+        normalize: bool = ...,
+        dtypes: Dtypes = ...,
+        wide: bool = ...,
+        **params: Any,
+    ) -> PartialResult:
+        ...
+
+    def get(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = False,
+        *,
+        partial: bool = False,
+        output: Output = "pandas",
+        normalize: bool = False,
+        dtypes: Dtypes = "inferred",
+        wide: bool = False,
+        **params: Any,
+    ) -> Any:
+        """Synchronous version of `AsyncClient.get`."""
+        return self._loop.run_until_complete(
+            self._client.get(  # type: ignore
+                endpoint,
+                tickers,
+                ignore_errors,
+                partial=partial,
+                output=output,
+                normalize=normalize,
+                dtypes=dtypes,
+                wide=wide,
+                **params,
+            )
+        )
+
+    def stream(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        ignore_errors: bool = False,
+        **params: Any,
+    ) -> Generator[Tuple[str, pd.DataFrame], None, None]:
+        """Synchronous version of `AsyncClient.stream`."""
+        return iterate_in_loop(self._loop, self._client.stream(endpoint, tickers, ignore_errors, **params))
+
+    def sink(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        sink: DatasetSink,
+        ignore_errors: bool = False,
+        **params: Any,
+    ) -> Manifest:
+        """Synchronous version of `AsyncClient.sink`."""
+        return self._loop.run_until_complete(self._client.sink(endpoint, tickers, sink, ignore_errors, **params))
+
+    @overload
+    def chunks(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        chunk_size: int = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+        **params: Any,
+    ) -> Iterator[pd.DataFrame]:
+        ...
+
+    @overload
+    def chunks(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        chunk_size: int = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[True],
+        **params: Any,
+    ) -> Iterator[PartialResult]:
+        ...
+
+    def chunks(
+        self,
+        endpoint: Endpoint,
+        tickers: Union[str, Iterable[str]],
+        chunk_size: int = 100,
+        ignore_errors: bool = False,
+        *,
+        partial: bool = False,
+        **params: Any,
+    ) -> Iterator[Union[pd.DataFrame, PartialResult]]:
+        """Synchronous version of `AsyncClient.chunks`."""
+        return iterate_in_loop(
+            self._loop,
+            self._client.chunks(  # type: ignore
+                endpoint, tickers, chunk_size, ignore_errors, partial=partial, **params
+            ),
+        )
+
+    @overload
+    def sync(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: str,
+        granularity: str = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[False] = ...,
+    ) -> pd.DataFrame:
+        ...
+
+    @overload
+    def sync(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: str,
+        granularity: str = ...,
+        ignore_errors: bool = ...,
+        *,
+        partial: Literal[True],
+    ) -> PartialResult:
+        ...
+
+    def sync(
+        self,
+        tickers: Union[str, Iterable[str]],
+        start: str,
+        granularity: str = "1d",
+        ignore_errors: bool = False,
+        *,
+        partial: bool = False,
+    ) -> Union[pd.DataFrame, PartialResult]:
+        """Synchronous version of `AsyncClient.sync`."""
+        return self._loop.run_until_complete(
+            self._client.sync(tickers, start, granularity, ignore_errors, partial=partial)  # type: ignore
+        )
+
+    def warmup(self, connections: int) -> None:
+        """Open up to `connections` connections to the API ahead of a burst of requests."""
+        self._loop.run_until_complete(self._client.warmup(connections))
+
+    def close(self) -> None:
+        """Close the session and its connections, then the event loop. The client cannot be used afterwards."""
+        if self._loop.is_closed():
+            return
+        self._loop.run_until_complete(self._client.close())
+        self._loop.close()
+
+    def __enter__(self) -> Client:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+_T = TypeVar("_T")
+
+
+def iterate_in_loop(loop: asyncio.AbstractEventLoop, iterator: AsyncIterator[_T]) -> Generator[_T, None, None]:
+    """Drive an asynchronous iterator from synchronous code, one item at a time."""
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None and not loop.is_closed():
+            loop.run_until_complete(aclose())
@@ -0,0 +1,154 @@
+"""
+    Helpers to build and merge column blocks, a columnar alternative to lists of records.
+
+    A column block maps each column name to a one dimensional `numpy.ndarray`,
+    all arrays of a block sharing the same length.
+"""
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+from pyhoo.types import Columns
+
+
+def to_array(values: Union[Sequence[Any], np.ndarray], length: int) -> np.ndarray:
+    """Convert a sequence of values to an array, padded with `None` up to `length`.
+    Mirrors `itertools.zip_longest` so that columns of different lengths can be aligned.
+    Arrays of the right length are used as is, without copy.
+    """
+    if len(values) < length:
+        values = (values.tolist() if isinstance(values, np.ndarray) else list(values)) + [None] * (length - len(values))
+    return _coerce_object(np.asarray(values))
+
+
+def broadcast(value: Any, length: int) -> np.ndarray:
+    """Repeat a scalar value `length` times, without going through a Python list."""
+    if value is None or isinstance(value, str):
+        return np.full(length, value, dtype=object)
+    return np.full(length, value)
+
+
+def from_records(records: Sequence[Mapping[str, Any]]) -> Columns:
+    """Build a column block from a list of records, keeping the first seen key order."""
+    keys: Dict[str, None] = {}
+    for record in records:
+        keys.update(dict.fromkeys(record))
+    return {key: to_array([record.get(key) for record in records], len(records)) for key in keys}
+
+
+def concatenate(blocks: Iterable[Columns]) -> Columns:
+    """Concatenate column blocks, filling the columns missing from a block with `None`."""
+    blocks = [block for block in blocks if block]
+    keys: Dict[str, None] = {}
+    for block in blocks:
+        keys.update(dict.fromkeys(block))
+    columns: Columns = {}
+    for key in keys:
+        arrays: List[np.ndarray] = [block[key] if key in block else broadcast(None, length(block)) for block in blocks]
+        columns[key] = arrays[0] if len(arrays) == 1 else _coerce_object(np.concatenate(arrays))
+    return columns
+
+
+def take(block: Columns, index: np.ndarray) -> Columns:
+    """Select rows of a column block, by positions or boolean mask."""
+    return {key: values[index] for key, values in block.items()}
+
+
+def deduplicate(block: Columns, keys: Sequence[str], keep_order: bool = False) -> Columns:
+    """Sort a column block by `keys`, the first one being the primary key, and drop the duplicated rows.
+    The last occurrence of a duplicated row is kept, so that newer rows replace older ones.
+    With `keep_order`, the rows left are not sorted, each one staying at the position of its last occurrence.
+    """
+    if not length(block):
+        return block
+    order = np.lexsort([block[key] for key in reversed(keys)])
+    sorted_keys = [block[key][order] for key in keys]
+    is_last = np.ones(len(order), dtype=bool)
+    is_last[:-1] = np.logical_or.reduce([values[1:] != values[:-1] for values in sorted_keys])
+    return take(block, np.sort(order[is_last]) if keep_order else order[is_last])
+
+
+class Pivot(NamedTuple):
+    """Wide layout of a long block: one row per distinct tuple of `keys`,
+    one column per distinct value of the `names` column, holding the `values` column.
+    """
+
+    keys: Sequence[str]
+    names: str
+    values: str
+
+
+def pivot(block: Columns, layout: Pivot, dtype: Any = np.float64) -> Columns:
+    """Reshape a long block to the wide `layout`, rows sorted by keys, value columns sorted by name.
+    Value columns are of `dtype`, missing values being `NaN`. Of the rows sharing the same keys and name,
+    e.g. when a ticker is requested twice, the last one is kept.
+    Values are scattered into one array holding every value column, instead of grouping the rows.
+    """
+    if not length(block):
+        return {}
+    factorized = [_factorize(block[key]) for key in layout.keys]
+    sizes = tuple(len(uniques) for uniques, _ in factorized)
+    row_codes, rows = np.unique(np.ravel_multi_index([codes for _, codes in factorized], sizes), return_inverse=True)
+    names, name_codes = _factorize(block[layout.names])
+    # Last row of each cell, as scattering duplicated cells would keep any of their values
+    cells = rows * len(names) + name_codes
+    _, last_reversed = np.unique(cells[::-1], return_index=True)
+    last = len(cells) - 1 - last_reversed
+    # one row of `table` per value column, so that every column is a contiguous view
+    table = np.full((len(names), len(row_codes)), np.nan, dtype=dtype)
+    table[name_codes[last], rows[last]] = block[layout.values][last].astype(dtype)
+    key_codes = np.unravel_index(row_codes, sizes)
+    columns: Columns = {key: uniques[codes] for key, (uniques, _), codes in zip(layout.keys, factorized, key_codes)}
+    columns.update({str(name): table[position] for position, name in enumerate(names)})
+    return columns
+
+
+def length(block: Columns) -> int:
+    """Number of rows of a column block."""
+    return len(next(iter(block.values()))) if block else 0
+
+
+def _coerce_object(array: np.ndarray) -> np.ndarray:
+    """Convert `object` arrays made of numbers and `None` to floats, `None` becoming `NaN`.
+    This is the inference `pandas` applies when building a frame from records.
+    """
+    if array.dtype != object:
+        return array
+    try:
+        # Fails on the first string which is not a number, so that string columns are rejected at once
+        floats = array.astype(float)
+    except (TypeError, ValueError):
+        return array
+    # Numeric strings and booleans are converted too, but must be kept as they are
+    types = set(map(type, array.tolist()))
+    types.discard(type(None))
+    if not types or not all(issubclass(value_type, (int, float)) and value_type is not bool for value_type in types):
+        return array
+    return floats
+
+
+def _factorize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted distinct values of an array, and the position of each value among them.
+    `object` arrays are hashed, `numpy.unique` being much slower on them than on numbers.
+    """
+    if values.dtype != object:
+        return np.unique(values, return_inverse=True)
+    listed = values.tolist()
+    positions = {value: position for position, value in enumerate(dict.fromkeys(listed))}
+    codes = np.fromiter(map(positions.__getitem__, listed), np.intp, len(listed))
+    uniques = np.empty(len(positions), dtype=object)
+    uniques[:] = list(positions)
+    order = np.argsort(uniques, kind="stable")
+    ranks = np.empty(len(order), dtype=np.intp)
+    ranks[order] = np.arange(len(order))
+    return uniques[order], ranks[codes]
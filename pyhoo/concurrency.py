@@ -0,0 +1,150 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, List, Optional, Tuple, Union
+
+
+class Slot:
+    """Handle on one request in flight, to be flagged as `failed` when the server throttles or errors."""
+
+    failed: bool
+
+    def __init__(self) -> None:
+        self.failed = False
+
+
+class AdaptiveConcurrency:
+    """Adjust the number of requests in flight with AIMD (additive increase, multiplicative decrease).
+
+    Each successful request grows the window by `increase / window`, so by about `increase` per window of requests.
+    A failed request (throttling, server error, connection error) or one slower than `latency_threshold`
+    multiplies the window by `decrease_factor`, at most once per smoothed latency, as requests
+    sent before the decrease would otherwise decrease it again.
+
+    The window stays between `min_window` and `max_window`, the changes are recorded in `history`.
+    """
+
+    min_window: int
+    max_window: int
+    increase: float
+    decrease_factor: float
+    latency_threshold: Optional[float]
+    latency: Optional[float]
+    in_flight: int
+    history: Deque[Tuple[float, int]]
+    _window: float
+    _last_decrease: float
+    _waiters: Deque["asyncio.Future[None]"]
+
+    _LATENCY_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        initial_window: int = 10,
+        min_window: int = 1,
+        max_window: int = 100,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        history_size: int = 1000,
+    ) -> None:
+        self.min_window = min_window
+        self.max_window = max_window
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.latency = None
+        self.in_flight = 0
+        self.history = deque(maxlen=history_size)
+        self._window = float(initial_window)
+        self._last_decrease = float("-inf")
+        self._waiters = deque()
+        self._record_window()
+
+    @property
+    def window(self) -> int:
+        """Maximum number of requests in flight at the moment."""
+        return int(self._window)
+
+    def windows(self) -> List[int]:
+        """Successive values taken by the window."""
+        return [window for _, window in self.history]
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[Slot]:
+        """Wait for a free slot in the window, then measure the request made within it."""
+        await self._acquire()
+        slot = Slot()
+        start = time.monotonic()
+        cancelled = False
+        try:
+            yield slot
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+        except BaseException:
+            slot.failed = True
+            raise
+        finally:
+            self.in_flight -= 1
+            if cancelled:
+                # Says nothing about the server health
+                self._wake_up()
+            else:
+                self.record(time.monotonic() - start, slot.failed)
+
+    def record(self, latency: float, failed: bool) -> None:
+        """Update the window according to the outcome of one request."""
+        self.latency = (
+            latency
+            if self.latency is None
+            else (1 - self._LATENCY_SMOOTHING) * self.latency + self._LATENCY_SMOOTHING * latency
+        )
+        slow = self.latency_threshold is not None and latency > self.latency_threshold
+        if failed or slow:
+            now = time.monotonic()
+            if now - self._last_decrease >= self.latency:
+                self._last_decrease = now
+                self._set_window(self._window * self.decrease_factor)
+        else:
+            self._set_window(self._window + self.increase / self._window)
+        self._wake_up()
+
+    async def _acquire(self) -> None:
+        while self.in_flight >= self.window:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+
+    def _wake_up(self) -> None:
+        free_slots = self.window - self.in_flight
+        while free_slots > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free_slots -= 1
+
+    def _set_window(self, window: float) -> None:
+        previous = self.window
+        self._window = min(float(self.max_window), max(float(self.min_window), window))
+        if self.window != previous:
+            self._record_window()
+
+    def _record_window(self) -> None:
+        self.history.append((time.time(), self.window))
+
+
+@asynccontextmanager
+async def unlimited_slot() -> AsyncIterator[Slot]:
+    """Slot used when the concurrency is not adaptive, the connection pool being the only limit."""
+    yield Slot()
+
+
+# Either a fixed number of requests in flight, or an adaptive window
+Concurrency = Union[int, AdaptiveConcurrency]
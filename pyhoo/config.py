@@ -1,17 +1,22 @@
 import datetime
+import math
 from pathlib import Path
 from typing import (
     Any,
     Callable,
+    Collection,
     Dict,
     Iterable,
+    List,
     Optional,
+    Sequence,
     Type,
     TypeVar,
     Union,
     cast,
 )
 
+from pyhoo.columns import Pivot
 from pyhoo.errors import (
     InvalidParameterPrefixError,
     InvalidParameterTypeError,
@@ -21,12 +26,25 @@ from pyhoo.errors import (
 )
 from pyhoo.parsers import ChartParser, FundamentalsParser, OptionsParser
 from pyhoo.parsers.abc import BaseParser
+from pyhoo.schema import Schema
+from pyhoo.types import ApiResponse
+from pyhoo.types.chart import ChartDataRecord, ChartMetaDictBase
+from pyhoo.types.fundamentals import (
+    FundamentalsDataRowDict,
+    FundamentalsMetaDict,
+)
+from pyhoo.types.options import OptionQuoteDict, OptionsDataRecord
 
 _T = TypeVar("_T")
 _V = TypeVar("_V")
 
 FUNDAMENTALS_TYPE_OPTIONS_PATH = Path(__file__).parent / "data/fundamentals_type_options.txt"
 
+# Columns repeating the same few values over many rows
+CHART_META_COLUMNS = list(ChartMetaDictBase.__annotations__)
+FUNDAMENTALS_META_COLUMNS = [*FundamentalsMetaDict.__annotations__, "periodType", "currencyCode"]
+OPTIONS_META_COLUMNS = ["underlyingSymbol", "type", "currency", "contractSize"]
+
 
 class ParamConfig:
     def __init__(
@@ -39,7 +57,12 @@ class ParamConfig:
         default: Optional[Any] = None,
         options: Optional[Iterable[_T]] = None,
         prefixes: Optional[Iterable[str]] = None,
+        local: bool = False,
+        minimum: Optional[float] = None,
     ) -> None:
+        """A `local` parameter is only used to split the requests, it is never sent to the API.
+        A number parameter can be given its `minimum` value.
+        """
         self.name = name
         self.api_name = api_name
         self.type = type
@@ -48,6 +71,8 @@ class ParamConfig:
         self.required = required
         self.options = {option for option in options or []}
         self.prefixes = prefixes or []
+        self.local = local
+        self.minimum = minimum
 
     def validate(self, value: _T) -> None:
         if not isinstance(value, self.type):
@@ -58,6 +83,8 @@ class ParamConfig:
                 unprefixed_value = self._unprefix(cast(str, _value))
                 if unprefixed_value not in self.options:
                     raise InvalidParameterValueError(self.name, unprefixed_value, self.options)
+        if self.minimum is not None and cast(float, value) < self.minimum:
+            raise InvalidParameterValueError(self.name, value, [f">= {self.minimum}"])
 
     def format(self, value: _T) -> Union[_T, _V]:
         if self.converter:
@@ -86,11 +113,41 @@ class Config:
         response_field: str,
         parser: Type[BaseParser],
         params_config: Iterable[ParamConfig],
+        splitter: Optional[Callable[[Dict[str, Any]], List[Dict[str, Any]]]] = None,
+        unique_keys: Sequence[str] = (),
+        expander: Optional[Callable[[Dict[str, Any], Dict[str, ApiResponse]], List[Dict[str, Any]]]] = None,
+        keeper: Optional[Callable[[Dict[str, Any], Dict[str, ApiResponse]], bool]] = None,
+        meta_columns: Collection[str] = (),
+        meta_key: Optional[str] = None,
+        schema: Schema = Schema(),
+        wide: Optional[Pivot] = None,
     ) -> None:
+        """`splitter` splits the API parameters of a ticker into several requests, each one given by
+        the parameters overriding the base ones. Rows sharing the same `unique_keys` are then deduplicated,
+        when the requests of a ticker were split.
+        `expander` reads the response to a request and gives the parameters of the further requests to send
+        for the same ticker. `keeper` tells whether the response to a request is kept, its further requests
+        being sent either way.
+        `meta_columns` repeat a few values over many rows, they are dictionary encoded in Arrow outputs.
+        `meta_key` is the symbol column keying the meta table of a normalized output, if the endpoint supports it:
+        it tells that `normalize` is supported, and requires the `parser` to implement `to_tables`.
+        `schema` gives the dtypes of the output columns, when they are not inferred from the values.
+        `wide` is the layout of the wide output, if the endpoint supports it.
+        """
+        if meta_key is not None and parser.to_tables is BaseParser.to_tables:
+            raise TypeError(f"{parser.__name__} must implement to_tables for its endpoint to have a meta_key")
         self.path = path
         self.response_field = response_field
         self.parser = parser
         self.params_config = {param.name: param for param in params_config}
+        self.splitter = splitter
+        self.unique_keys = unique_keys
+        self.expander = expander
+        self.keeper = keeper
+        self.meta_columns = meta_columns
+        self.meta_key = meta_key
+        self.schema = schema
+        self.wide = wide
 
     def validate(self, params: Dict[str, Any]) -> None:
         for param, value in params.items():
@@ -111,11 +168,105 @@ class Config:
             for param, value in params.items()
         }
 
+    def split(self, api_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Parameters of each request to send for one ticker, on top of `request_params(api_params)`."""
+        if self.splitter is None:
+            return [{}]
+        return self.splitter(api_params)
+
+    def expand(self, api_params: Dict[str, Any], response: Dict[str, ApiResponse]) -> List[Dict[str, Any]]:
+        """Parameters of the further requests to send for the ticker of `response`, on top of its own ones."""
+        if self.expander is None:
+            return []
+        return self.expander(api_params, response)
+
+    def keep(self, api_params: Dict[str, Any], response: Dict[str, ApiResponse]) -> bool:
+        """Whether the response to a request is kept, every response being kept without `keeper`."""
+        if self.keeper is None:
+            return True
+        return self.keeper(api_params, response)
+
+    def request_params(self, api_params: Dict[str, Any]) -> Dict[str, Any]:
+        """API parameters sent with every request, the `local` ones removed."""
+        local_params = {param.api_name for param in self.params_config.values() if param.local}
+        return {param: value for param, value in api_params.items() if param not in local_params}
+
 
 def str_date_to_timestamp(str_date: str) -> int:
     return int(datetime.datetime.timestamp(datetime.datetime.strptime(str_date, "%Y-%m-%d")))
 
 
+# Longest period served in one `chart` request, by intraday granularity, in seconds
+MAX_CHART_PERIODS = {
+    "1m": 7 * 86400,
+    "2m": 60 * 86400,
+    "5m": 60 * 86400,
+    "15m": 60 * 86400,
+    "30m": 60 * 86400,
+    "1h": 730 * 86400,
+}
+
+
+def split_chart_period(api_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split `[period1, period2)` into consecutive windows no longer than the granularity allows."""
+    max_period = MAX_CHART_PERIODS.get(api_params.get("interval", ""))
+    if max_period is None or "range" in api_params:
+        return [{}]
+    start, end = api_params["period1"], api_params["period2"]
+    if end - start <= max_period:
+        return [{}]
+    return [
+        {"period1": window_start, "period2": min(window_start + max_period, end)}
+        for window_start in range(start, end, max_period)
+    ]
+
+
+def split_fundamentals_types(api_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Split the comma separated `type` into chunks of `types_per_request` types, requested concurrently.
+    A type given twice would be returned by two requests, so duplicates are dropped.
+    """
+    types = list(dict.fromkeys(api_params["type"].split(",")))
+    types_per_request = api_params["types_per_request"]
+    if len(types) <= types_per_request:
+        return [{}]
+    return [
+        {"type": ",".join(types[index : index + types_per_request])}
+        for index in range(0, len(types), types_per_request)
+    ]
+
+
+def expand_options_expirations(api_params: Dict[str, Any], response: Dict[str, ApiResponse]) -> List[Dict[str, Any]]:
+    """With `expirations="all"`, request every expiration date listed by the first response
+    within `[expirationMin, expirationMax]`, except the one it already holds.
+    """
+    result = response["optionChain"]["result"]
+    if api_params["expirations"] != "all" or not result:
+        return []
+    chain = result[0]
+    returned = {option["expirationDate"] for option in chain.get("options", [])}
+    expiration_min = api_params.get("expirationMin", -math.inf)
+    expiration_max = api_params.get("expirationMax", math.inf)
+    return [
+        {"date": expiration_date}
+        for expiration_date in chain.get("expirationDates", [])
+        if expiration_date not in returned and expiration_min <= expiration_date <= expiration_max
+    ]
+
+
+def keep_options_expiration(api_params: Dict[str, Any], response: Dict[str, ApiResponse]) -> bool:
+    """With `expirations="all"`, drop the first response when the nearest expiration it holds
+    is outside `[expirationMin, expirationMax]`.
+    """
+    result = response["optionChain"]["result"]
+    if api_params["expirations"] != "all" or not result:
+        return True
+    expiration_min = api_params.get("expirationMin", -math.inf)
+    expiration_max = api_params.get("expirationMax", math.inf)
+    return all(
+        expiration_min <= option["expirationDate"] <= expiration_max for option in result[0].get("options", [])
+    )
+
+
 with open(FUNDAMENTALS_TYPE_OPTIONS_PATH, "r") as file:
     fundamentals_type_options = [line.strip() for line in file.readlines()]
 
@@ -156,6 +307,15 @@ endpoints_config = {
                 options=["1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"],
             ),
         ],
+        splitter=split_chart_period,
+        unique_keys=["symbol", "timestamp"],
+        meta_columns=CHART_META_COLUMNS,
+        meta_key="symbol",
+        schema=Schema.from_types(
+            ChartDataRecord,
+            categories=CHART_META_COLUMNS,
+            timestamps=["timestamp", "firstTradeDate", "regularMarketTime"],
+        ),
     ),
     "fundamentals": Config(
         path="ws/fundamentals-timeseries/v1/finance/timeseries",
@@ -186,7 +346,20 @@ endpoints_config = {
                 converter=lambda values: ",".join(values),
                 prefixes=["monthly", "quarterly", "annual"],
             ),
+            ParamConfig(
+                name="types_per_request",
+                api_name="types_per_request",
+                type=int,
+                required=True,
+                default=20,
+                local=True,
+                minimum=1,
+            ),
         ],
+        splitter=split_fundamentals_types,
+        meta_columns=FUNDAMENTALS_META_COLUMNS,
+        schema=Schema.from_types(FundamentalsDataRowDict, categories=FUNDAMENTALS_META_COLUMNS, dates=["asOfDate"]),
+        wide=Pivot(keys=["symbol", "asOfDate", "periodType"], names="type", values="reportedValue"),
     ),
     "options": Config(
         path="v7/finance/options",
@@ -219,6 +392,50 @@ endpoints_config = {
                 type=float,
                 required=False,
             ),
+            ParamConfig(
+                name="expirations",
+                api_name="expirations",
+                type=str,
+                required=True,
+                default="nearest",
+                options=["nearest", "all"],
+                local=True,
+            ),
+            ParamConfig(
+                name="expirationMin",
+                api_name="expirationMin",
+                type=str,
+                required=False,
+                converter=str_date_to_timestamp,
+                local=True,
+            ),
+            ParamConfig(
+                name="expirationMax",
+                api_name="expirationMax",
+                type=str,
+                required=False,
+                converter=str_date_to_timestamp,
+                local=True,
+            ),
         ],
+        expander=expand_options_expirations,
+        keeper=keep_options_expiration,
+        meta_columns=OPTIONS_META_COLUMNS,
+        meta_key="underlyingSymbol",
+        schema=Schema.from_types(
+            OptionsDataRecord,
+            OptionQuoteDict,
+            categories=OPTIONS_META_COLUMNS,
+            timestamps=[
+                "expiration",
+                "lastTradeDate",
+                "regularMarketTime",
+                "preMarketTime",
+                "dividendDate",
+                "earningsTimestamp",
+                "earningsTimestampStart",
+                "earningsTimestampEnd",
+            ],
+        ),
     ),
 }
@@ -0,0 +1,164 @@
+import asyncio
+import functools
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    DefaultDict,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import numpy as np
+
+from pyhoo.columns import Pivot, concatenate, deduplicate, length, pivot
+from pyhoo.errors import ApiError
+from pyhoo.output import Output, to_output
+from pyhoo.parsers.abc import BaseParser
+from pyhoo.results import NormalizedResult, PartialResult, TickerFailure
+from pyhoo.schema import Schema
+from pyhoo.types import ApiResponse, Columns, ErrorDescription, Tables
+
+_T = TypeVar("_T")
+
+
+def is_iterable(obj: Any) -> bool:
+    """Check that an object is iterable but not a string (strings are iterable)."""
+    return hasattr(obj, "__iter__") and not isinstance(obj, str)
+
+
+def parse_response(
+    response: Dict[str, ApiResponse],
+    response_field: str,
+    parser: Type[BaseParser],
+    ignore_errors: bool,
+    normalize: bool = False,
+) -> Union[List[Columns], List[Tables]]:
+    """Parse one API response into column blocks, one per result, or pairs of data and meta blocks with `normalize`."""
+    response_data = response[response_field]
+    if response_data.get("error") is not None:
+        if ignore_errors:
+            return []
+        error = cast(ErrorDescription, response_data["error"])
+        raise ApiError(error["code"], error["description"])
+    result = response_data["result"]
+    if result is None:
+        return []
+    if normalize:
+        return [parser(**data).to_tables() for data in result]
+    return [parser(**data).to_columns() for data in result]
+
+
+def response_parser(
+    response_field: str,
+    parser: Type[BaseParser],
+    ignore_errors: bool,
+    executor: Optional[Executor] = None,
+    normalize: bool = False,
+) -> Callable[[Dict[str, ApiResponse]], Awaitable[Union[List[Columns], List[Tables]]]]:
+    """Coroutine function parsing one response, in the event loop thread or in the workers of `executor`.
+    A `ProcessPoolExecutor` bypasses the GIL, the column blocks being sent back as compact `numpy` arrays.
+    """
+    parse = functools.partial(
+        parse_response,
+        response_field=response_field,
+        parser=parser,
+        ignore_errors=ignore_errors,
+        normalize=normalize,
+    )
+
+    async def parse_in_executor(response: Dict[str, ApiResponse]) -> Union[List[Columns], List[Tables]]:
+        if executor is None:
+            return parse(response)
+        return await asyncio.get_running_loop().run_in_executor(executor, parse, response)
+
+    return parse_in_executor
+
+
+def convert_to_output(
+    parsed: Iterable[List[Columns]],
+    unique_keys: Sequence[str] = (),
+    output: Output = "pandas",
+    meta_columns: Collection[str] = (),
+    schema: Optional[Schema] = None,
+    wide: Optional[Pivot] = None,
+) -> Any:
+    """Merge the column blocks parsed from every response into one frame, or another `output`,
+    reshaped to the `wide` layout if given, its value columns being floats of the `schema`.
+    """
+    columns = merge_blocks((block for blocks in parsed for block in blocks), unique_keys)
+    if wide is not None:
+        columns = pivot(columns, wide, np.float64 if schema is None else schema.float_dtype)
+    return to_output(columns, output, meta_columns, schema)
+
+
+def merge_blocks(blocks: Iterable[Columns], unique_keys: Sequence[str] = ()) -> Columns:
+    """Concatenate column blocks, keeping only the last of the rows sharing the same `unique_keys` if any.
+    Rows keep the order of the blocks, i.e. the order the tickers were requested in.
+    """
+    columns = concatenate(blocks)
+    if unique_keys and all(key in columns for key in unique_keys):
+        return deduplicate(columns, unique_keys, keep_order=True)
+    return columns
+
+
+def convert_to_tables(
+    parsed: Iterable[List[Tables]],
+    unique_keys: Sequence[str],
+    meta_key: str,
+    output: Output = "pandas",
+    meta_columns: Collection[str] = (),
+    schema: Optional[Schema] = None,
+) -> NormalizedResult:
+    """Merge the data blocks and the meta blocks parsed from every response into two tables,
+    the meta table holding one row per `meta_key`.
+    """
+    tables = [ticker_tables for response_tables in parsed for ticker_tables in response_tables]
+    data = merge_blocks((data for data, _ in tables), unique_keys)
+    meta = merge_blocks((meta for _, meta in tables), [meta_key])
+    return NormalizedResult(
+        data=to_output(data, output, meta_columns, schema),
+        meta=to_output(meta, output, schema=schema),
+    )
+
+
+def split_tables(columns: Columns, meta_columns: Collection[str], meta_key: str) -> Tables:
+    """Normalize a block holding its meta data on every row, as `BaseParser.to_tables` does."""
+    data = {name: values for name, values in columns.items() if name == meta_key or name not in meta_columns}
+    meta = {name: values for name, values in columns.items() if name in meta_columns}
+    return data, deduplicate(meta, [meta_key], keep_order=True) if length(meta) else meta
+
+
+def convert_to_partial_result(
+    parsed: Iterable[Tuple[str, Union[List[_T], BaseException]]],
+    convert: Callable[[Iterable[List[_T]]], Any],
+) -> PartialResult:
+    """Same as `convert` applied to every parsed response, e.g. `convert_to_output`,
+    but tickers failing to be fetched or parsed are reported instead of raised.
+    A ticker requested several times is reported once, and none of its data is kept if any request failed.
+    """
+    succeeded: DefaultDict[str, List[List[_T]]] = defaultdict(list)
+    failures: Dict[str, TickerFailure] = {}
+    for ticker, ticker_parsed in parsed:
+        if isinstance(ticker_parsed, BaseException):
+            failures.setdefault(ticker, TickerFailure(ticker, ticker_parsed))
+        else:
+            succeeded[ticker].append(ticker_parsed)
+    data = convert(
+        response_parsed
+        for ticker, ticker_parsed in succeeded.items()
+        if ticker not in failures
+        for response_parsed in ticker_parsed
+    )
+    return PartialResult(data=data, failures=list(failures.values()))
@@ -0,0 +1,45 @@
+"""
+    JSON decoders of the API responses, reading raw bytes.
+
+    `orjson` and `simdjson` are optional dependencies, used when installed since they decode
+    much faster than the standard library, which remains the fallback.
+"""
+import json
+from typing import Any, Callable, Dict, Union
+
+from pyhoo.errors import InvalidParameterValueError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover, optional dependency
+    orjson = None  # type: ignore
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover, optional dependency
+    simdjson = None
+
+Decoder = Callable[[bytes], Any]
+
+# Either the name of a decoder, "auto" for the fastest one installed, or a custom decoder
+JsonDecoder = Union[str, Decoder]
+
+DECODERS: Dict[str, Decoder] = {"json": json.loads}
+if simdjson is not None:
+    DECODERS["simdjson"] = simdjson.loads
+if orjson is not None:
+    DECODERS["orjson"] = orjson.loads
+
+# Decoder names, from the fastest to the slowest
+_PREFERENCE = ("orjson", "simdjson", "json")
+
+
+def get_decoder(json_decoder: JsonDecoder = "auto") -> Decoder:
+    """Resolve a decoder by name, a custom decoder being returned as is."""
+    if callable(json_decoder):
+        return json_decoder
+    if json_decoder == "auto":
+        return next(DECODERS[name] for name in _PREFERENCE if name in DECODERS)
+    if json_decoder not in DECODERS:
+        raise InvalidParameterValueError("json_decoder", json_decoder, ["auto", *DECODERS])
+    return DECODERS[json_decoder]
@@ -33,3 +33,18 @@ class MissingParameterError(CustomException):
 class ApiError(CustomException):
     def __init__(self, code: str, description: str) -> None:
         super().__init__(f"Got error '{code}' from Yahoo Finance API, reason was: '{description}'")
+
+
+class HttpStatusError(CustomException):
+    def __init__(self, status: int, url: str) -> None:
+        self.status = status
+        super().__init__(f"Got status {status} from Yahoo Finance API on '{url}'.")
+
+
+class UnsupportedPlatformError(CustomException):
+    pass
+
+
+class MissingDependencyError(CustomException):
+    def __init__(self, feature: str, package: str) -> None:
+        super().__init__(f"{feature} requires `{package}`, install it with `pip install {package}`.")
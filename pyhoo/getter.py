@@ -1,9 +1,21 @@
-from typing import Any, Dict, cast
+import asyncio
+import json
+from typing import Any, Dict, Optional, cast
+from urllib.parse import urlsplit
 
 import aiohttp
 
+from pyhoo.cache import ResponseCache
+from pyhoo.concurrency import AdaptiveConcurrency, unlimited_slot
+from pyhoo.decoder import Decoder
+from pyhoo.errors import HttpStatusError
+from pyhoo.rate_limiter import RateLimiter
+from pyhoo.retry import RetryPolicy
 from pyhoo.types import ApiResponse
 
+# Single attempt, the response is decoded whatever its status
+_NO_RETRY = RetryPolicy(max_attempts=1, retry_statuses=(), retry_exceptions=())
+
 
 class GetTickerDataTask:
 
@@ -12,6 +24,7 @@ class GetTickerDataTask:
     _params: Dict[str, Any]
 
     _BASE_URL = "https://query2.finance.yahoo.com"
+    _HOST = urlsplit(_BASE_URL).netloc
 
     def __init__(
         self,
@@ -23,11 +36,68 @@ class GetTickerDataTask:
         self._ticker = ticker
         self._params = params
 
-    async def run(self, session: aiohttp.ClientSession) -> Dict[str, ApiResponse]:
-        response = await session.request("GET", url=self._url)
-        data = cast(Dict[str, ApiResponse], await response.json())
+    async def run(
+        self,
+        session: aiohttp.ClientSession,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        cache: Optional[ResponseCache] = None,
+        decoder: Decoder = json.loads,
+    ) -> Dict[str, ApiResponse]:
+        """Fetch and decode the ticker data, retrying transient errors according to `retry_policy`.
+        Each attempt first waits for the `rate_limiter` approval, then for a free slot in the `concurrency` window.
+        Successful responses are looked up in and saved to the `cache`, if any.
+        The raw body is decoded with `decoder`.
+        """
+        if cache is None:
+            return await self._fetch(session, retry_policy, rate_limiter, concurrency, decoder)
+        loop = asyncio.get_running_loop()
+        cached = await loop.run_in_executor(None, cache.get, self._path, self._ticker, self._params)
+        if cached is not None:
+            return cast(Dict[str, ApiResponse], cached)
+        data = await self._fetch(session, retry_policy, rate_limiter, concurrency, decoder)
+        if all(response.get("error") is None for response in data.values()):
+            await loop.run_in_executor(None, cache.set, self._path, self._ticker, self._params, data)
         return data
 
+    async def _fetch(
+        self,
+        session: aiohttp.ClientSession,
+        retry_policy: Optional[RetryPolicy],
+        rate_limiter: Optional[RateLimiter],
+        concurrency: Optional[AdaptiveConcurrency],
+        decoder: Decoder,
+    ) -> Dict[str, ApiResponse]:
+        retry_policy = retry_policy or _NO_RETRY
+        attempt = 1
+        while True:
+            if rate_limiter is not None:
+                await rate_limiter.acquire(self._HOST)
+            try:
+                async with concurrency.slot() if concurrency is not None else unlimited_slot() as slot:
+                    response = await session.request("GET", url=self._url)
+                    if response.status not in retry_policy.retry_statuses:
+                        data = cast(Dict[str, ApiResponse], decoder(await response.read()))
+                        return data
+                    slot.failed = True
+                    response.release()
+                if not retry_policy.can_retry(attempt):
+                    raise HttpStatusError(response.status, self._url)
+                delay = retry_policy.delay(attempt, response.headers.get("Retry-After"))
+            except retry_policy.retry_exceptions:
+                if not retry_policy.can_retry(attempt):
+                    raise
+                delay = retry_policy.delay(attempt)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @classmethod
+    async def ping(cls, session: aiohttp.ClientSession) -> None:
+        """Send a lightweight request to the API host, leaving an open connection in the session pool."""
+        response = await session.request("HEAD", url=cls._BASE_URL)
+        response.release()
+
     @property
     def _url(self) -> str:
         url = f"{self._BASE_URL}/{self._path}/{self._ticker}"
@@ -1,19 +1,30 @@
 import abc
-from dataclasses import dataclass
-from typing import Any, Optional
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterator, List, Optional, Type, TypeVar, cast
+
+_M = TypeVar("_M", bound="BaseModel")
 
 
 class BaseModel(metaclass=abc.ABCMeta):
     """Base class for API response sub keys.
     Provide a user friendly `__repr__` method.
+
+    Models are built for every row of a response, they declare `__slots__` to spare the memory of a `__dict__`.
     """
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         formatted_attrs = ", ".join(
-            attr_name + "=" + attr_value.__repr__() for attr_name, attr_value in self.__dict__.items()
+            attr_name + "=" + attr_value.__repr__() for attr_name, attr_value in self._attributes().items()
         )
         return f"{self.__class__.__name__}({formatted_attrs})"
 
+    def _attributes(self) -> Dict[str, Any]:
+        attributes = {name: getattr(self, name) for name in _slots(type(self)) if hasattr(self, name)}
+        attributes.update(getattr(self, "__dict__", {}))
+        return attributes
+
 
 @dataclass(frozen=True)
 class OptionalFieldsModel(BaseModel):
@@ -22,9 +33,44 @@ class OptionalFieldsModel(BaseModel):
     It allows for less verbose dataclass declaration.
     """
 
+    __slots__ = ()
+
     def __init_subclass__(cls, *args: Any, **kwargs: Any) -> None:
         for field, value in cls.__annotations__.items():
             cls.__annotations__[field] = Optional[value]
             if not hasattr(cls, field):
                 setattr(cls, field, None)
         super().__init_subclass__(*args, **kwargs)  # type: ignore
+
+
+def slotted(cls: Type[_M]) -> Type[_M]:
+    """Equivalent of `dataclass(slots=True)`, only available from Python 3.10.
+    The dataclass is created again with one slot per field, and without `__dict__`.
+    Field defaults are kept by the generated `__init__`, so they are removed from the class attributes.
+    """
+    dataclass_type: Any = cls
+    field_names = tuple(field.name for field in fields(dataclass_type))
+    namespace = {
+        name: value
+        for name, value in dataclass_type.__dict__.items()
+        if name not in field_names and name not in ("__dict__", "__weakref__")
+    }
+    namespace["__slots__"] = field_names
+
+    # Frozen dataclasses can't be unpickled by setting their attributes
+    def __getstate__(self: Any) -> List[Any]:
+        return [getattr(self, name) for name in field_names]
+
+    def __setstate__(self: Any, state: List[Any]) -> None:
+        for name, value in zip(field_names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__getstate__"] = __getstate__
+    namespace["__setstate__"] = __setstate__
+    return cast(Type[_M], type(dataclass_type)(dataclass_type.__name__, dataclass_type.__bases__, namespace))
+
+
+def _slots(cls: type) -> Iterator[str]:
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        yield from (slots,) if isinstance(slots, str) else slots
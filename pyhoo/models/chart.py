@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import enum
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Optional
 
-from pyhoo.models.abc import BaseModel, OptionalFieldsModel
+from pyhoo.models.abc import BaseModel, OptionalFieldsModel, slotted
 from pyhoo.types.chart import (
+    ChartMetaDict,
     ChartMetaDictBase,
     CurrentTradingPeriodDict,
     IndicatorsDict,
@@ -27,7 +29,33 @@ class Interval(enum.Enum):
     ONE_MONTH = "1mo"
     THREE_MONTHS = "3mo"
 
-
+    @property
+    def seconds(self) -> int:
+        """Duration of one bar, approximated for months."""
+        return _INTERVAL_SECONDS[self]
+
+    @property
+    def intraday(self) -> bool:
+        """Whether bars are shorter than a day."""
+        return _INTERVAL_SECONDS[self] < _INTERVAL_SECONDS[Interval.ONE_DAY]
+
+
+_INTERVAL_SECONDS = {
+    Interval.ONE_MIN: 60,
+    Interval.TWO_MIN: 2 * 60,
+    Interval.FIVE_MIN: 5 * 60,
+    Interval.FIFTEEN_MIN: 15 * 60,
+    Interval.THIRTY_MIN: 30 * 60,
+    Interval.ONE_HOUR: 60 * 60,
+    Interval.ONE_DAY: 24 * 60 * 60,
+    Interval.FIVE_DAYS: 5 * 24 * 60 * 60,
+    Interval.ONE_WEEK: 7 * 24 * 60 * 60,
+    Interval.ONE_MONTH: 31 * 24 * 60 * 60,
+    Interval.THREE_MONTHS: 92 * 24 * 60 * 60,
+}
+
+
+@slotted
 @dataclass(frozen=True)
 class Quote(OptionalFieldsModel):
 
@@ -38,6 +66,7 @@ class Quote(OptionalFieldsModel):
     low: List[float]
 
 
+@slotted
 @dataclass(frozen=True)
 class AdjClose(BaseModel):
 
@@ -46,6 +75,8 @@ class AdjClose(BaseModel):
 
 class Indicators(BaseModel):
 
+    __slots__ = ("quote", "adjclose")
+
     quote: Quote
     adjclose: AdjClose
 
@@ -54,6 +85,7 @@ class Indicators(BaseModel):
         self.adjclose = AdjClose(**indicators.get("adjclose", [{}])[0])
 
 
+@slotted
 @dataclass(frozen=True)
 class TradingPeriod(OptionalFieldsModel):
 
@@ -65,6 +97,8 @@ class TradingPeriod(OptionalFieldsModel):
 
 class CurrentTradingPeriod(BaseModel):
 
+    __slots__ = ("pre", "regular", "post", "tradingPeriods")
+
     pre: TradingPeriod
     regular: TradingPeriod
     post: TradingPeriod
@@ -114,13 +148,10 @@ class ChartMeta(BaseModel):
     regularMarketPrice: float
     chartPreviousClose: float
     priceHint: int
-    currentTradingPeriod: CurrentTradingPeriod
     dataGranularity: Interval
     range: Range
-    validRanges: List[Range]
     previousClose: Optional[float]
     scale: Optional[int]
-    tradingPeriods: Optional[List[TradingPeriod]]
 
     def __init__(
         self,
@@ -144,6 +175,7 @@ class ChartMeta(BaseModel):
         scale: Optional[int] = None,
         tradingPeriods: Optional[List[List[TradingPeriodDict]]] = None,
     ) -> None:
+        """The trading periods and valid ranges, rarely used, are only built when accessed."""
         self.currency = currency
         self.symbol = symbol
         self.exchangeName = exchangeName
@@ -156,18 +188,52 @@ class ChartMeta(BaseModel):
         self.regularMarketPrice = regularMarketPrice
         self.chartPreviousClose = chartPreviousClose
         self.priceHint = priceHint
-        self.currentTradingPeriod = CurrentTradingPeriod(**currentTradingPeriod)
         self.dataGranularity = Interval(dataGranularity)
         self.range = Range(range)
-        self.validRanges = [Range(valid_range) for valid_range in validRanges]
         self.previousClose = previousClose
         self.scale = scale
-        self.tradingPeriods = [
+        self._currentTradingPeriod = currentTradingPeriod
+        self._validRanges = validRanges
+        self._tradingPeriods = tradingPeriods
+
+    @cached_property
+    def currentTradingPeriod(self) -> CurrentTradingPeriod:
+        return CurrentTradingPeriod(**self._currentTradingPeriod)
+
+    @cached_property
+    def validRanges(self) -> List[Range]:
+        return [Range(valid_range) for valid_range in self._validRanges]
+
+    @cached_property
+    def tradingPeriods(self) -> List[TradingPeriod]:
+        return [
             TradingPeriod(**trading_period)
-            for trading_period_sequence in tradingPeriods or [[]]
+            for trading_period_sequence in self._tradingPeriods or [[]]
             for trading_period in trading_period_sequence
         ]
 
+    @staticmethod
+    def record(meta: ChartMetaDict) -> ChartMetaDictBase:
+        """Same values as `to_dict`, read from the decoded response without building the model."""
+        return {
+            "currency": meta["currency"],
+            "symbol": meta["symbol"],
+            "exchangeName": meta["exchangeName"],
+            "instrumentType": meta["instrumentType"],
+            "firstTradeDate": meta["firstTradeDate"],
+            "regularMarketTime": meta["regularMarketTime"],
+            "gmtoffset": meta["gmtoffset"],
+            "timezone": meta["timezone"],
+            "exchangeTimezoneName": meta["exchangeTimezoneName"],
+            "regularMarketPrice": meta["regularMarketPrice"],
+            "chartPreviousClose": meta["chartPreviousClose"],
+            "previousClose": meta.get("previousClose"),
+            "priceHint": meta["priceHint"],
+            "dataGranularity": meta["dataGranularity"],
+            "range": meta.get("range") or None,
+            "scale": meta.get("scale"),
+        }
+
     def to_dict(self) -> ChartMetaDictBase:
         return {
             "currency": self.currency,
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Optional, Sequence, TypeVar
 
-from pyhoo.models.abc import BaseModel, OptionalFieldsModel
+from pyhoo.models.abc import BaseModel, OptionalFieldsModel, slotted
 from pyhoo.types.fundamentals import ReportedValueDict
 
 
+@slotted
 @dataclass(frozen=True)
 class ReportedValue(OptionalFieldsModel):
 
@@ -14,6 +15,8 @@ class ReportedValue(OptionalFieldsModel):
 
 class FundamentalsRow(BaseModel):
 
+    __slots__ = ("dataId", "asOfDate", "periodType", "reportedValue", "currencyCode")
+
     dataId: int
     asOfDate: str
     periodType: str
@@ -40,6 +43,8 @@ _T = TypeVar("_T")
 
 class FundamentalsMeta(BaseModel):
 
+    __slots__ = ("symbol", "type")
+
     symbol: str
     type: str
 
@@ -6,11 +6,24 @@
     Ex:
         # Timestamp is defined below
         timestamp: Timestamp = attr.ib(converter=Timestamp)
+
+    Values are held in a `numpy` array, iterated over and converted without any Python loop.
 """
 from __future__ import annotations
 
 import datetime
-from typing import Generic, List, TypeVar
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+    Iterator,
+    List,
+    Sequence,
+    TypeVar,
+    cast,
+)
+
+import numpy as np
 
 from pyhoo.models.abc import BaseModel
 
@@ -19,50 +32,53 @@ _T = TypeVar("_T")
 
 class CustomIterable(BaseModel, Generic[_T]):
 
-    _values: List[_T]
+    __slots__ = ("_values",)
+
+    # Dtype of the values, inferred from them when `None`
+    dtype: ClassVar[Any] = None
+
+    _values: np.ndarray
 
-    def __init__(self, values: List[_T]) -> None:
-        self._values = values
+    def __init__(self, values: Sequence[_T]) -> None:
+        self._values = np.asarray(values, dtype=self.dtype)
 
-    def __iter__(self) -> "CustomIterator[_T]":
-        return CustomIterator(self)
+    def __iter__(self) -> Iterator[_T]:
+        return iter(self._values.tolist())
 
     def __getitem__(self, index: int) -> _T:
-        return self._values[index]
+        # `tolist` gives back Python objects: a scalar for an index, a list for a slice
+        return cast(_T, self._values[index].tolist())
 
     def __len__(self) -> int:
         return len(self._values)
 
+    @property
+    def values(self) -> np.ndarray:
+        """Underlying values, to avoid iterating element by element."""
+        return self._values
 
-class CustomIterator(Generic[_T]):
-
-    _iterable: CustomIterable[_T]
-    _index: int
-
-    def __init__(self, iterable: CustomIterable[_T]) -> None:
-        self._iterable = iterable
-        self._index = 0
 
-    def __next__(self) -> _T:
-        if self._index < len(self._iterable):
-            result = self._iterable[self._index]
-            self._index += 1
-            return result
-        raise StopIteration
+class Timestamp(CustomIterable[int]):
 
-    def __iter__(self) -> CustomIterator[_T]:
-        return self
+    __slots__ = ()
 
+    dtype = np.int64
 
-class Timestamp(CustomIterable[int]):
     def to_str(self, format: str = "%Y-%m-%dT%H:%M:%S") -> List[str]:
         """Convert each timestamp to a datetime object and then format it as specified."""
-        return list(map(lambda date: date.strftime(format), self.to_datetime()))
+        return [date.strftime(format) for date in self.to_datetime()]
 
     def to_datetime(self) -> List[datetime.datetime]:
-        """Convert each timestamp to a datetime object."""
-        return list(map(datetime.datetime.fromtimestamp, self))
+        """Convert each timestamp to a datetime object, in the local time zone."""
+        return list(map(datetime.datetime.fromtimestamp, self._values.tolist()))
+
+    def to_datetime64(self) -> np.ndarray:
+        """Convert the timestamps, in seconds since epoch, to UTC `datetime64[s]`, without any Python loop."""
+        return self._values.astype("datetime64[s]")
 
 
 class Strikes(CustomIterable[float]):
-    pass
+
+    __slots__ = ()
+
+    dtype = np.float64
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Iterable, Optional
 
-from pyhoo.models.abc import BaseModel, OptionalFieldsModel
+from pyhoo.models.abc import BaseModel, OptionalFieldsModel, slotted
 from pyhoo.types.options import OptionDict
 
 
+@slotted
 @dataclass(frozen=True)
 class Option(OptionalFieldsModel):
 
@@ -25,6 +26,7 @@ class Option(OptionalFieldsModel):
     openInterest: int
 
 
+@slotted
 @dataclass(frozen=True)
 class OptionQuote(OptionalFieldsModel):
 
@@ -106,6 +108,8 @@ class OptionQuote(OptionalFieldsModel):
 
 class Options(BaseModel):
 
+    __slots__ = ("expirationDate", "hasMiniOptions", "calls", "puts")
+
     expirationDate: Optional[int]
     hasMiniOptions: Optional[bool]
     calls: Iterable[Option]
@@ -0,0 +1,132 @@
+"""
+    Conversion of column blocks to the output requested by the user: a `pandas.DataFrame`,
+    the column block itself as a dict of `numpy` arrays, or a `pyarrow.Table`.
+
+    `pandas` and `pyarrow` are only imported when their output is requested,
+    so that pipelines ending in Arrow-native engines never import `pandas`.
+"""
+from typing import TYPE_CHECKING, Any, Collection, Literal, Optional
+
+import numpy as np
+
+from pyhoo.errors import InvalidParameterValueError, MissingDependencyError
+from pyhoo.schema import Schema
+from pyhoo.types import Columns
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+    import pyarrow as pa
+
+Output = Literal["pandas", "numpy", "arrow"]
+
+OUTPUTS = ("pandas", "numpy", "arrow")
+
+# Largest number of bytes held by a `string` array
+_MAX_STRING_BYTES = 2**31 - 1
+
+
+def validate_output(output: str) -> None:
+    if output not in OUTPUTS:
+        raise InvalidParameterValueError("output", output, OUTPUTS)
+
+
+def to_output(
+    columns: Columns,
+    output: Output = "pandas",
+    meta_columns: Collection[str] = (),
+    schema: Optional[Schema] = None,
+) -> Any:
+    """Convert a column block to `output`, `meta_columns` being dictionary encoded in Arrow tables.
+    With a `schema`, columns are cast to its dtypes, its categories being categoricals or dictionary encoded.
+    """
+    validate_output(output)
+    categories: Collection[str] = ()
+    if schema is not None:
+        columns, categories = schema.apply(columns), schema.categories
+    if output == "numpy":
+        return columns
+    if output == "arrow":
+        return to_arrow(columns, {*meta_columns, *categories})
+    return to_frame(columns, categories)
+
+
+def to_frame(columns: Columns, categories: Collection[str] = ()) -> "pd.DataFrame":
+    import pandas as pd
+
+    return pd.DataFrame(
+        {name: pd.Categorical(values) if name in categories else values for name, values in columns.items()}
+    )
+
+
+def to_arrow(columns: Columns, dictionary_columns: Collection[str] = ()) -> "pa.Table":
+    """Build a table from a column block, the string `dictionary_columns`, repeating a few values,
+    being dictionary encoded. `NaN`, `NaT` and `None` become nulls, as they stand for missing values
+    in the parsed blocks.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise MissingDependencyError('output="arrow"', "pyarrow")
+
+    arrays = {}
+    for name, values in columns.items():
+        array = _to_arrow_array(pa, values)
+        is_string = pa.types.is_string(array.type) or pa.types.is_large_string(array.type)
+        arrays[name] = array.dictionary_encode() if name in dictionary_columns and is_string else array
+    return pa.table(arrays)
+
+
+def _to_arrow_array(pa: Any, values: np.ndarray) -> "pa.Array":
+    """Wrap the buffers of `values` in an Arrow array, without copying numeric columns.
+    `pyarrow.array` imports `pandas` whenever it is installed, so it is only used for object columns
+    holding something else than strings and booleans.
+    """
+    kind = values.dtype.kind
+    if kind in "iuf":
+        values = np.ascontiguousarray(values)
+        missing = np.isnan(values) if kind == "f" else None
+        return _from_buffers(pa, pa.from_numpy_dtype(values.dtype), len(values), missing, values)
+    if kind == "M":
+        values = np.ascontiguousarray(values)
+        data = values.view(np.int64)
+        return _from_buffers(pa, pa.from_numpy_dtype(values.dtype), len(values), np.isnat(values), data)
+    if kind == "b":
+        return _from_buffers(pa, pa.bool_(), len(values), None, _pack(values))
+    if kind == "U":
+        values = values.astype(object)
+    if kind in "OU":
+        missing = np.equal(values, None)  # type: ignore
+        types = set(map(type, values.tolist()))
+        types.discard(type(None))
+        if not types:
+            # Only missing values, e.g. a field absent from every record, which has no type to infer
+            return pa.nulls(len(values))
+        if types <= {str}:
+            strings = np.where(missing, "", values).tolist()
+            encoded = "".join(strings).encode()
+            lengths = np.fromiter(map(len, strings), np.int64, len(strings))
+            if len(encoded) != lengths.sum():
+                # Characters out of ASCII take several bytes, each string must be encoded to count them
+                lengths = np.fromiter(map(len, map(str.encode, strings)), np.int64, len(strings))
+            offsets = np.zeros(len(values) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=offsets[1:])
+            # `string` arrays have 32 bits offsets, the longer ones need `large_string`
+            if offsets[-1] <= _MAX_STRING_BYTES:
+                return _from_buffers(pa, pa.string(), len(values), missing, offsets.astype(np.int32), encoded)
+            return _from_buffers(pa, pa.large_string(), len(values), missing, offsets, encoded)
+        if types <= {bool, np.bool_}:
+            data = _pack(np.where(missing, False, values).astype(bool))
+            return _from_buffers(pa, pa.bool_(), len(values), missing, data)
+    return pa.array(values, from_pandas=True)
+
+
+def _from_buffers(
+    pa: Any, type: "pa.DataType", length: int, missing: Optional[np.ndarray], *buffers: Any
+) -> "pa.Array":
+    validity = pa.py_buffer(_pack(~missing)) if missing is not None and missing.any() else None
+    return pa.Array.from_buffers(type, length, [validity, *(pa.py_buffer(buffer) for buffer in buffers)])
+
+
+def _pack(flags: np.ndarray) -> np.ndarray:
+    """Arrow bitmaps hold one bit per value, least significant bit first."""
+    return np.packbits(flags, bitorder="little")
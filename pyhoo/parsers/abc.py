@@ -1,6 +1,9 @@
 import abc
 from typing import Any, List
 
+from pyhoo.columns import from_records
+from pyhoo.types import Columns, Tables
+
 
 class BaseParser(metaclass=abc.ABCMeta):
     @abc.abstractmethod
@@ -11,6 +14,17 @@ class BaseParser(metaclass=abc.ABCMeta):
     def to_records(self) -> List[Any]:
         pass
 
+    def to_columns(self) -> Columns:
+        """Columnar version of `to_records`, parsers can override it with a faster implementation."""
+        return from_records(self.to_records())
+
+    def to_tables(self) -> Tables:
+        """Normalized version of `to_columns`: the data block, keyed by symbol, and a one row meta block.
+        Only the parsers of the endpoints having a `meta_key` implement it, which `Config` checks:
+        `normalize` is rejected for the other endpoints before any request is sent.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} has no meta table")
+
     def __repr__(self) -> str:
         formatted_attrs = ", ".join(
             attr_name + "=" + attr_value.__repr__() for attr_name, attr_value in self.__dict__.items()
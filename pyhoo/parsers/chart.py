@@ -1,22 +1,41 @@
+from functools import cached_property
 from itertools import zip_longest
-from typing import List, cast
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
 
+import numpy as np
+
+from pyhoo.columns import broadcast, from_records, length, to_array
 from pyhoo.models.chart import ChartMeta, Indicators
 from pyhoo.models.iterables import Timestamp
 from pyhoo.parsers.abc import BaseParser
+from pyhoo.types import Columns, Tables
 from pyhoo.types.chart import ChartDataRecord, ChartMetaDict, IndicatorsDict
 
 
 class ChartParser(BaseParser):
 
-    meta: ChartMeta
     timestamp: Timestamp
-    indicators: Indicators
 
-    def __init__(self, meta: ChartMetaDict, timestamp: List[int], indicators: IndicatorsDict) -> None:
-        self.meta = ChartMeta(**meta)
-        self.timestamp = Timestamp(timestamp)
-        self.indicators = Indicators(indicators)
+    def __init__(
+        self,
+        meta: ChartMetaDict,
+        timestamp: Optional[List[int]] = None,
+        indicators: Optional[IndicatorsDict] = None,
+    ) -> None:
+        """`timestamp`, and possibly `indicators`, are missing when there is no bar in the requested period.
+        The `meta` and `indicators` models are only built when accessed, columns are read from the decoded response.
+        """
+        self._meta = meta
+        self._indicators = indicators or cast(IndicatorsDict, {})
+        self.timestamp = Timestamp(timestamp or [])
+
+    @cached_property
+    def meta(self) -> ChartMeta:
+        return ChartMeta(**self._meta)
+
+    @cached_property
+    def indicators(self) -> Indicators:
+        return Indicators(self._indicators)
 
     def to_records(self) -> List[ChartDataRecord]:
         return [
@@ -43,3 +62,30 @@ class ChartParser(BaseParser):
                 self.indicators.adjclose.adjclose,
             )
         ]
+
+    def to_columns(self) -> Columns:
+        """Build one array per bar field, meta values are broadcast once to the number of bars."""
+        columns = self._bar_columns()
+        bars = length(columns)
+        columns.update({name: broadcast(value, bars) for name, value in ChartMeta.record(self._meta).items()})
+        return columns
+
+    def to_tables(self) -> Tables:
+        """Bars keyed by symbol, the other meta values being held once in the meta block."""
+        columns = self._bar_columns()
+        bars = {"symbol": broadcast(self._meta["symbol"], length(columns)), **columns}
+        return bars, from_records([ChartMeta.record(self._meta)])
+
+    def _bar_columns(self) -> Columns:
+        quote = self._indicators.get("quote", [{}])[0]
+        series: Dict[str, Union[Sequence[Any], np.ndarray]] = {
+            "timestamp": self.timestamp.values,
+            "high": quote.get("high") or [],
+            "low": quote.get("low") or [],
+            "volume": quote.get("volume") or [],
+            "open": quote.get("open") or [],
+            "close": quote.get("close") or [],
+            "adjclose": self._indicators.get("adjclose", [{}])[0].get("adjclose", []),
+        }
+        bars = max(len(values) for values in series.values())
+        return {name: to_array(values, bars) for name, values in series.items()}
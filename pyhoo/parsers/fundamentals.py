@@ -1,8 +1,11 @@
-from typing import Dict, Iterable, List, Optional
+from functools import cached_property
+from typing import Any, Iterable, List, Optional
 
+from pyhoo.columns import broadcast, to_array
 from pyhoo.models.fundamentals import FundamentalsMeta, FundamentalsRow
 from pyhoo.models.iterables import Timestamp
 from pyhoo.parsers.abc import BaseParser
+from pyhoo.types import Columns
 from pyhoo.types.fundamentals import (
     FundamentalsDataRowDict,
     FundamentalsMetaDict,
@@ -17,29 +20,48 @@ class FundamentalsParser(BaseParser):
         timestamp: Optional[List[int]] = None,
         **data: Iterable[FundamentalsRowDict],
     ) -> None:
+        """The rows, under the name of the fundamentals type in the response, are only built when accessed."""
         self.meta = FundamentalsMeta(**meta)
         self.timestamp = Timestamp(timestamp or [])
-        self._parse_data(data)
+        self._rows = list(next(iter(data.values()))) if data else []
 
-    def _parse_data(self, data: Dict[str, Iterable[FundamentalsRowDict]]) -> None:
-        fundamentals_name = self.meta.type
-        fundamentals_data = next(iter(data.values())) if data else []
-        setattr(
-            self,
-            fundamentals_name,
-            [FundamentalsRow(**row) for row in fundamentals_data],
-        )
+    @cached_property
+    def rows(self) -> List[FundamentalsRow]:
+        return [FundamentalsRow(**row) for row in self._rows]
+
+    def __getattr__(self, name: str) -> Any:
+        """Rows are also available under the name of their fundamentals type, e.g. `parser.annualTotalRevenue`."""
+        meta = self.__dict__.get("meta")
+        if meta is not None and name == meta.type:
+            return self.rows
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
     def to_records(self) -> List[FundamentalsDataRowDict]:
+        """Read from the decoded response, without building the row models."""
         return [
             {
                 "type": self.meta.type,
                 "symbol": self.meta.symbol,
-                "dataId": row.dataId,
-                "asOfDate": row.asOfDate,
-                "periodType": row.periodType,
-                "reportedValue": row.reportedValue.raw,
-                "currencyCode": row.currencyCode,
+                "dataId": row["dataId"],
+                "asOfDate": row["asOfDate"],
+                "periodType": row["periodType"],
+                "reportedValue": row["reportedValue"].get("raw"),
+                "currencyCode": row.get("currencyCode"),
             }
-            for row in getattr(self, self.meta.type)
+            for row in self._rows
         ]
+
+    def to_columns(self) -> Columns:
+        """Build one array per field straight from the rows of the response, without building the row models."""
+        if not self._rows:
+            return {}
+        rows = len(self._rows)
+        return {
+            "type": broadcast(self.meta.type, rows),
+            "symbol": broadcast(self.meta.symbol, rows),
+            "dataId": to_array([row["dataId"] for row in self._rows], rows),
+            "asOfDate": to_array([row["asOfDate"] for row in self._rows], rows),
+            "periodType": to_array([row["periodType"] for row in self._rows], rows),
+            "reportedValue": to_array([row["reportedValue"].get("raw") for row in self._rows], rows),
+            "currencyCode": to_array([row.get("currencyCode") for row in self._rows], rows),
+        }
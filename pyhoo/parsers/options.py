@@ -1,11 +1,21 @@
-from dataclasses import asdict
+from dataclasses import asdict, fields
+from functools import cached_property
 from typing import List, Sequence, cast
 
+import numpy as np
+
+from pyhoo.columns import broadcast, from_records, to_array
 from pyhoo.models.iterables import Strikes, Timestamp
-from pyhoo.models.options import OptionQuote, Options
+from pyhoo.models.options import Option, OptionQuote, Options
 from pyhoo.parsers.abc import BaseParser
+from pyhoo.types import Columns, Tables
 from pyhoo.types.options import OptionQuoteDict, OptionsDataRecord, OptionsDict
 
+_OPTION_FIELDS = [field.name for field in fields(Option)]
+
+# Each contract type is one string object, repeated by reference
+_CONTRACT_TYPES = np.array(["CALL", "PUT"], dtype=object)
+
 
 class OptionsParser(BaseParser):
 
@@ -13,8 +23,6 @@ class OptionsParser(BaseParser):
     expirationDates: Timestamp
     strikes: Strikes
     hasMiniOptions: bool
-    quote: OptionQuote
-    options: Options
 
     def __init__(
         self,
@@ -29,8 +37,17 @@ class OptionsParser(BaseParser):
         self.expirationDates = Timestamp(expirationDates)
         self.strikes = Strikes(strikes)
         self.hasMiniOptions = hasMiniOptions
-        self.quote = OptionQuote(**quote)
-        self.options = Options(**options[0]) if options else Options()
+        self._quote = quote
+        self._options = options[0] if options else None
+
+    @cached_property
+    def quote(self) -> OptionQuote:
+        """Built when accessed only, the quote of the underlying is not part of the contract rows."""
+        return OptionQuote(**self._quote)
+
+    @cached_property
+    def options(self) -> Options:
+        return Options(**self._options) if self._options is not None else Options()
 
     def to_records(self) -> List[OptionsDataRecord]:
         return [
@@ -45,3 +62,25 @@ class OptionsParser(BaseParser):
             for option, type in [(call, "CALL") for call in self.options.calls]
             + [(put, "PUT") for put in self.options.puts]
         ]
+
+    def to_columns(self) -> Columns:
+        """Build one array per contract field straight from the `calls` and `puts` of the response,
+        without building the `Option` models.
+        """
+        calls = list(self._options.get("calls") or []) if self._options is not None else []
+        puts = list(self._options.get("puts") or []) if self._options is not None else []
+        contracts = [*calls, *puts]
+        if not contracts:
+            return {}
+        columns = {
+            "underlyingSymbol": broadcast(self.underlyingSymbol, len(contracts)),
+            "type": np.repeat(_CONTRACT_TYPES, [len(calls), len(puts)]),
+        }
+        for name in _OPTION_FIELDS:
+            columns[name] = to_array([contract.get(name) for contract in contracts], len(contracts))
+        return columns
+
+    def to_tables(self) -> Tables:
+        """Contracts keyed by underlying symbol, along with the quote of the underlying."""
+        quote = {field.name: self._quote.get(field.name) for field in fields(OptionQuote)}
+        return self.to_columns(), from_records([{"underlyingSymbol": self.underlyingSymbol, **quote}])
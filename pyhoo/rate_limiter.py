@@ -0,0 +1,126 @@
+import abc
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from pyhoo.errors import UnsupportedPlatformError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover, not available on Windows
+    fcntl = None  # type: ignore
+
+# Number of tokens left and time of the last refill
+_BucketState = Tuple[float, float]
+
+_GLOBAL_KEY = "*"
+
+
+class RateLimiter(metaclass=abc.ABCMeta):
+    """Limit the rate at which requests are sent, awaited by `GetTickerDataTask` before each attempt."""
+
+    @abc.abstractmethod
+    async def acquire(self, host: str) -> None:
+        pass
+
+
+class TokenBucket(RateLimiter):
+    """Allow `rate` requests per second on average, with bursts of up to `capacity` requests.
+    With `per_host`, each host gets its own bucket.
+
+    One bucket can be shared by several calls and clients of the same process, even running in different threads.
+    """
+
+    rate: float
+    capacity: float
+    per_host: bool
+    _buckets: Dict[str, _BucketState]
+    _lock: threading.Lock
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, per_host: bool = False) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.per_host = per_host
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    async def acquire(self, host: str) -> None:
+        key = host if self.per_host else _GLOBAL_KEY
+        while True:
+            wait = await self._take_without_blocking(key)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    async def _take_without_blocking(self, key: str) -> float:
+        """Same as `_take`, which only holds the lock of the bucket for a few operations."""
+        return self._take(key)
+
+    def _take(self, key: str) -> float:
+        """Take a token from the bucket, return 0 on success, else the number of seconds to wait for one."""
+        with self._lock:
+            state, wait = self._refill_and_take(self._buckets.get(key), self._now())
+            self._buckets[key] = state
+        return wait
+
+    def _refill_and_take(self, state: Optional[_BucketState], now: float) -> Tuple[_BucketState, float]:
+        tokens, updated = state if state is not None else (self.capacity, now)
+        tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+        if tokens >= 1:
+            return (tokens - 1, now), 0.0
+        return (tokens, now), (1 - tokens) / self.rate
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket whose state is stored in a local file, locked on each access.
+    Every process using the same `path` shares the same budget, e.g. several workers on one host.
+
+    Only available on POSIX systems.
+    """
+
+    path: Path
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        rate: float,
+        capacity: Optional[float] = None,
+        per_host: bool = False,
+    ) -> None:
+        if fcntl is None:
+            raise UnsupportedPlatformError("FileTokenBucket requires `fcntl`, only available on POSIX systems.")
+        super().__init__(rate, capacity, per_host)
+        self.path = Path(path)
+
+    async def _take_without_blocking(self, key: str) -> float:
+        """Lock and update the file in a thread, as the lock may be held by another process for a while."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._take, key)
+
+    def _take(self, key: str) -> float:
+        with open(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666), "r+") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                content = file.read()
+                buckets: Dict[str, _BucketState] = json.loads(content) if content else {}
+                state, wait = self._refill_and_take(buckets.get(key), self._now())
+                buckets[key] = state
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps(buckets))
+                file.flush()
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+        return wait
+
+    @staticmethod
+    def _now() -> float:
+        # Monotonic clocks are not comparable between processes
+        return time.time()
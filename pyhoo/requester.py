@@ -1,46 +1,187 @@
 import asyncio
-from typing import Any, Dict, Iterable, List, cast
+import itertools
+import json
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
 
 import aiohttp
 
+from pyhoo.cache import ResponseCache
+from pyhoo.concurrency import AdaptiveConcurrency
+from pyhoo.decoder import Decoder
 from pyhoo.getter import GetTickerDataTask
+from pyhoo.rate_limiter import RateLimiter
+from pyhoo.retry import RetryPolicy
 from pyhoo.types import ApiResponse
 
 
+class Query(NamedTuple):
+    """One request to send: a ticker and its own parameters, on top of the `Requester` ones."""
+
+    ticker: str
+    params: Dict[str, Any] = {}
+
+
 class Requester:
 
     _path: str
-    _tickers: Iterable[str]
+    _queries: Iterable[Query]
     _max_concurrent_calls: int
+    _retry_policy: Optional[RetryPolicy]
+    _rate_limiter: Optional[RateLimiter]
+    _concurrency: Optional[AdaptiveConcurrency]
+    _cache: Optional[ResponseCache]
+    _decoder: Decoder
+    _expand: Optional[Callable[[Dict[str, ApiResponse]], List[Dict[str, Any]]]]
+    _keep: Optional[Callable[[Dict[str, ApiResponse]], bool]]
+    _parse: Optional[Callable[[Dict[str, ApiResponse]], Awaitable[Any]]]
     _params: Dict[str, Any]
 
     def __init__(
         self,
         path: str,
-        tickers: Iterable[str],
+        tickers: Iterable[str] = (),
         max_concurrent_calls: int = 100,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        cache: Optional[ResponseCache] = None,
+        decoder: Decoder = json.loads,
+        queries: Optional[Iterable[Query]] = None,
+        expand: Optional[Callable[[Dict[str, ApiResponse]], List[Dict[str, Any]]]] = None,
+        keep: Optional[Callable[[Dict[str, ApiResponse]], bool]] = None,
+        parse: Optional[Callable[[Dict[str, ApiResponse]], Awaitable[Any]]] = None,
         **params: Any,
     ) -> None:
+        """Requests are sent by ticker, or by query if `queries` are given, to request the same ticker
+        several times with different parameters.
+        With `expand`, the response to each query is followed by concurrent requests for the same ticker,
+        with the parameters it gives on top of the query ones.
+        With `keep`, the response to a query is dropped when it is not kept, its further requests being sent anyway.
+        With `parse`, each response is replaced with its parsed value as soon as it is received,
+        so that parsing overlaps with the requests still in flight.
+        """
         self._path = path
-        self._tickers = tickers
+        self._queries = queries if queries is not None else (Query(ticker) for ticker in tickers)
         self._params = params
         self._max_concurrent_calls = max_concurrent_calls
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._concurrency = concurrency
+        self._cache = cache
+        self._decoder = decoder
+        self._expand = expand
+        self._keep = keep
+        self._parse = parse
+
+    async def request(self, session: Optional[aiohttp.ClientSession] = None) -> List[Any]:
+        """Asynchronously fire requests by ticker thanks to the `GetTickerDataTask`, returning the responses,
+        or their parsed values with `parse`.
+        If no session is given, a new one is opened for these requests only and closed afterwards.
+        """
+        async with self._session(session) as session:
+            tasks = [self._run_expanded(query, session) for query in self._queries]
+            responses = cast(List[List[Any]], await asyncio.gather(*tasks, return_exceptions=False))
+            return [response for query_responses in responses for response in query_responses]
+
+    async def request_settled(self, session: Optional[aiohttp.ClientSession] = None) -> List[Tuple[str, Any]]:
+        """Same as `request`, but a failing ticker does not abort the others.
+        Each ticker is paired with either its response or the exception it raised.
+        """
+        queries = list(self._queries)
+        async with self._session(session) as session:
+            tasks = [self._run_expanded(query, session) for query in queries]
+            responses = await asyncio.gather(*tasks, return_exceptions=True)
+            settled: List[Tuple[str, Any]] = []
+            for query, query_responses in zip(queries, responses):
+                if isinstance(query_responses, BaseException):
+                    settled.append((query.ticker, query_responses))
+                else:
+                    settled += [(query.ticker, response) for response in query_responses]
+            return settled
+
+    async def stream(
+        self, session: Optional[aiohttp.ClientSession] = None
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """Yield `(ticker, response)` pairs in completion order, instead of waiting for every ticker.
+        Only as many tickers as connections are fetched and parsed at once, the next ones being pulled from
+        the queries when a ticker is yielded: a slow consumer holds at most that many responses in memory.
+        """
+        queries = iter(self._queries)
+        pending: Set["asyncio.Future[Tuple[str, List[Any]]]"] = set()
+        async with self._session(session) as session:
+            try:
+                while True:
+                    for query in itertools.islice(queries, self._max_connections() - len(pending)):
+                        pending.add(asyncio.ensure_future(self._fetch(query, session)))
+                    if not pending:
+                        return
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        ticker, responses = task.result()
+                        for response in responses:
+                            yield ticker, response
+            finally:
+                # The consumer may stop iterating early, requests still in flight are useless
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
 
-    async def request(self) -> List[Dict[str, ApiResponse]]:
-        """Asynchronously fire requests by ticker thanks to the `GetTickerDataTask`."""
-        connector = aiohttp.TCPConnector(limit=self._max_concurrent_calls)
+    @asynccontextmanager
+    async def _session(self, session: Optional[aiohttp.ClientSession]) -> AsyncIterator[aiohttp.ClientSession]:
+        """Use the given session, or open one limited to `max_concurrent_calls` connections.
+        With an adaptive `concurrency`, the connection pool is sized after its maximum window instead.
+        """
+        if session is not None:
+            yield session
+            return
+        connector = aiohttp.TCPConnector(limit=self._max_connections())
         async with aiohttp.ClientSession(connector=connector) as session:
-            tasks = []
-            for ticker in self._tickers:
-                tasks.append(
-                    GetTickerDataTask(
-                        path=self._path,
-                        ticker=ticker,
-                        **self._params,
-                    ).run(session=session)
-                )
-            responses = cast(
-                List[Dict[str, ApiResponse]],
-                await asyncio.gather(*tasks, return_exceptions=False),
-            )
-            return responses
+            yield session
+
+    def _max_connections(self) -> int:
+        return self._concurrency.max_window if self._concurrency is not None else self._max_concurrent_calls
+
+    async def _run(self, query: Query, session: aiohttp.ClientSession) -> Dict[str, ApiResponse]:
+        task = GetTickerDataTask(path=self._path, ticker=query.ticker, **{**self._params, **query.params})
+        return await task.run(
+            session=session,
+            retry_policy=self._retry_policy,
+            rate_limiter=self._rate_limiter,
+            concurrency=self._concurrency,
+            cache=self._cache,
+            decoder=self._decoder,
+        )
+
+    async def _run_expanded(self, query: Query, session: aiohttp.ClientSession) -> List[Any]:
+        response = await self._run(query, session)
+        further_queries: List[Query] = []
+        if self._expand is not None:
+            further_queries = [Query(query.ticker, {**query.params, **params}) for params in self._expand(response)]
+        further = [self._run_parsed(further_query, session) for further_query in further_queries]
+        if self._keep is not None and not self._keep(response):
+            return list(await asyncio.gather(*further))
+        return list(await asyncio.gather(self._parsed(response), *further))
+
+    async def _run_parsed(self, query: Query, session: aiohttp.ClientSession) -> Any:
+        return await self._parsed(await self._run(query, session))
+
+    async def _parsed(self, response: Dict[str, ApiResponse]) -> Any:
+        return response if self._parse is None else await self._parse(response)
+
+    async def _fetch(self, query: Query, session: aiohttp.ClientSession) -> Tuple[str, List[Any]]:
+        return query.ticker, await self._run_expanded(query, session)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
+
+
+@dataclass(frozen=True)
+class TickerFailure:
+    """Why the data of one ticker could not be retrieved."""
+
+    ticker: str
+    exception: BaseException
+
+    @property
+    def error(self) -> str:
+        return type(self.exception).__name__
+
+    @property
+    def message(self) -> str:
+        return str(self.exception)
+
+
+@dataclass(frozen=True)
+class NormalizedResult:
+    """Data rows keyed by symbol, the meta data of each symbol being held once in a separate table.
+    Both are `pandas.DataFrame`, unless another output was requested.
+    """
+
+    data: Any
+    meta: Any
+
+
+@dataclass(frozen=True)
+class PartialResult:
+    """Data of the tickers that succeeded, along with a report of the ones that failed.
+    `data` is a `pandas.DataFrame`, unless another output was requested, or a `NormalizedResult`.
+    """
+
+    data: Any
+    failures: List[TickerFailure] = field(default_factory=list)
+
+    @property
+    def failed_tickers(self) -> List[str]:
+        """Tickers to retry."""
+        return [failure.ticker for failure in self.failures]
+
+    def report(self) -> pd.DataFrame:
+        """One row per failed ticker, with the error type and message."""
+        import pandas as pd
+
+        return pd.DataFrame(
+            [(failure.ticker, failure.error, failure.message) for failure in self.failures],
+            columns=["ticker", "error", "message"],
+        )
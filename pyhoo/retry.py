@@ -0,0 +1,74 @@
+import asyncio
+import datetime
+import email.utils
+import random
+from typing import Collection, Optional, Tuple, Type
+
+import aiohttp
+
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """How `GetTickerDataTask` retries a request failing with a transient error.
+
+    The delay before the n-th retry is drawn uniformly between 0 and `min(backoff_cap, backoff_base * 2 ** (n - 1))`
+    ("full jitter"), or is exactly that bound if `jitter` is disabled: the first retry waits up to `backoff_base`.
+    When the server sends a `Retry-After` header, it is honored instead, up to `backoff_cap`.
+    """
+
+    max_attempts: int
+    backoff_base: float
+    backoff_cap: float
+    jitter: bool
+    respect_retry_after: bool
+    retry_statuses: Collection[int]
+    retry_exceptions: Tuple[Type[BaseException], ...]
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.retry_statuses = retry_statuses
+        self.retry_exceptions = retry_exceptions
+
+    def can_retry(self, attempt: int) -> bool:
+        return attempt < self.max_attempts
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait after the `attempt`-th attempt failed."""
+        if self.respect_retry_after and retry_after is not None:
+            seconds = self._parse_retry_after(retry_after)
+            if seconds is not None:
+                return min(self.backoff_cap, seconds)
+        bound = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, bound) if self.jitter else bound
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> Optional[float]:
+        """`Retry-After` is either a number of seconds or an HTTP date."""
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            date = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, (date - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
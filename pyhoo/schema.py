@@ -0,0 +1,119 @@
+"""
+    Output schemas of the endpoints, derived from the record types of `pyhoo.types`,
+    to give the output columns explicit dtypes instead of the ones inferred from the values.
+"""
+from dataclasses import dataclass, field, replace
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+import numpy as np
+
+from pyhoo.errors import InvalidParameterValueError
+from pyhoo.types import Columns
+
+# "inferred" keeps the dtypes inferred from the values, "typed" applies the endpoint schema,
+# and "float32" also downcasts the float columns
+Dtypes = Literal["inferred", "typed", "float32"]
+
+DTYPES = ("inferred", "typed", "float32")
+
+
+def validate_dtypes(dtypes: str) -> None:
+    if dtypes not in DTYPES:
+        raise InvalidParameterValueError("dtypes", dtypes, DTYPES)
+
+
+@dataclass(frozen=True)
+class Schema:
+    """Types of the columns of an endpoint, `str`, `int`, `float` or `bool`.
+
+    Columns of `categories` become categoricals, `timestamps` columns, in seconds since epoch,
+    and `dates` columns, ISO formatted, become `datetime64[s]`. Numbers get fixed width dtypes:
+    `int64` unless a value is missing, `float64`, or `float32` with `float32`.
+    Columns the schema does not know keep their dtype.
+    """
+
+    types: Dict[str, type] = field(default_factory=dict)
+    categories: Collection[str] = ()
+    timestamps: Collection[str] = ()
+    dates: Collection[str] = ()
+    float32: bool = False
+
+    @classmethod
+    def from_types(
+        cls,
+        *record_types: Any,
+        categories: Collection[str] = (),
+        timestamps: Collection[str] = (),
+        dates: Collection[str] = (),
+    ) -> "Schema":
+        """Schema of the columns of `TypedDict` record types, `Optional` fields being typed as their value.
+        Only the `categories` typed as strings are kept, the other columns repeating a few values being numbers.
+        """
+        types = {
+            name: _unwrap_optional(annotation)
+            for record_type in record_types
+            for name, annotation in get_type_hints(record_type).items()
+        }
+        categories = [name for name in categories if types.get(name) is str]
+        return cls(types=types, categories=categories, timestamps=timestamps, dates=dates)
+
+    def for_dtypes(self, dtypes: Dtypes) -> Optional["Schema"]:
+        """Schema to apply for the `dtypes` requested by the user, `None` to keep the inferred ones."""
+        validate_dtypes(dtypes)
+        if dtypes == "inferred":
+            return None
+        return replace(self, float32=dtypes == "float32")
+
+    @property
+    def float_dtype(self) -> Any:
+        return np.float32 if self.float32 else np.float64
+
+    def apply(self, columns: Columns) -> Columns:
+        return {name: self._cast(name, values) for name, values in columns.items()}
+
+    def _cast(self, name: str, values: np.ndarray) -> np.ndarray:
+        if name in self.timestamps:
+            return _to_datetime(values)
+        if name in self.dates:
+            return values.astype("datetime64[s]")
+        column_type = self.types.get(name)
+        if column_type is int and values.dtype.kind in "iu":
+            return values.astype(np.int64, copy=False)
+        if column_type is int and values.dtype.kind == "f" and not np.isnan(values).any():
+            return values.astype(np.int64)
+        if column_type is float and values.dtype.kind in "iuf":
+            return values.astype(self.float_dtype, copy=False)
+        if column_type in (int, float) and values.dtype == object and np.equal(values, None).all():  # type: ignore
+            # Missing from every row, e.g. `adjclose` of intraday charts: kept numeric, but all `NaN`
+            return np.full(len(values), np.nan, dtype=self.float_dtype)
+        return values
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        arguments: Tuple[Any, ...] = tuple(argument for argument in get_args(annotation) if argument is not type(None))
+        return arguments[0] if len(arguments) == 1 else annotation
+    return annotation
+
+
+def _to_datetime(values: np.ndarray) -> np.ndarray:
+    """Seconds since epoch to `datetime64[s]`, missing values becoming `NaT`."""
+    if values.dtype.kind in "iu":
+        return values.astype("datetime64[s]")
+    if values.dtype.kind != "f":
+        return values
+    missing = np.isnan(values)
+    seconds = np.where(missing, 0, values).astype(np.int64).astype("datetime64[s]")
+    seconds[missing] = np.datetime64("NaT")
+    return seconds
@@ -0,0 +1,99 @@
+import asyncio
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterator, List, Literal, Set, Tuple, Union
+from urllib.parse import quote
+
+from pyhoo.columns import concatenate, length
+from pyhoo.errors import InvalidParameterValueError, MissingDependencyError
+from pyhoo.output import to_arrow
+from pyhoo.types import Columns
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as parquet
+except ImportError:  # pragma: no cover, optional dependency
+    pa = None  # type: ignore
+
+DatasetFormat = Literal["parquet", "feather"]
+
+
+@dataclass(frozen=True)
+class WrittenFile:
+    """One file written to a dataset."""
+
+    path: Path
+    endpoint: str
+    symbol: str
+    rows: int
+
+
+@dataclass(frozen=True)
+class Manifest:
+    """Files written to a dataset by one call."""
+
+    files: List[WrittenFile] = field(default_factory=list)
+
+    @property
+    def rows(self) -> int:
+        return sum(file.rows for file in self.files)
+
+    @property
+    def paths(self) -> List[Path]:
+        return [file.path for file in self.files]
+
+
+class DatasetSink:
+    """Dataset of Parquet or Feather files, partitioned by endpoint and symbol:
+    `directory/endpoint=chart/symbol=AAPL/part-<uuid>.parquet`.
+
+    The blocks parsed from each response are written to a single file, so that several calls, or processes,
+    can add files to the same partitions. Files are written in a background thread while the next responses
+    are fetched, at most `max_pending` files waiting to be written.
+    """
+
+    directory: Path
+    format: DatasetFormat
+    max_pending: int
+
+    def __init__(self, directory: Union[str, Path], format: DatasetFormat = "parquet", max_pending: int = 16) -> None:
+        if pa is None:
+            raise MissingDependencyError("DatasetSink", "pyarrow")
+        if format not in ("parquet", "feather"):
+            raise InvalidParameterValueError("format", format, ["parquet", "feather"])
+        self.directory = Path(directory)
+        self.format = format
+        self.max_pending = max_pending
+
+    def write(self, endpoint: str, symbol: str, block: Columns) -> WrittenFile:
+        """Write one column block to a new file of the `(endpoint, symbol)` partition."""
+        partition = self.directory / f"endpoint={endpoint}" / f"symbol={quote(symbol, safe='')}"
+        partition.mkdir(parents=True, exist_ok=True)
+        path = partition / f"part-{uuid.uuid4().hex}.{self.format}"
+        table = to_arrow(block)
+        if self.format == "parquet":
+            parquet.write_table(table, path)
+        else:
+            feather.write_feather(table, path)
+        return WrittenFile(path=path, endpoint=endpoint, symbol=symbol, rows=length(block))
+
+    async def write_all(self, endpoint: str, parsed: AsyncIterator[Tuple[str, List[Columns]]]) -> Manifest:
+        """Write the blocks of each `(symbol, blocks)` pair to one file as soon as it is received,
+        in a background thread.
+        """
+        loop = asyncio.get_running_loop()
+        files: List[WrittenFile] = []
+        pending: Set["asyncio.Future[WrittenFile]"] = set()
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyhoo-sink") as writer:
+            async for symbol, blocks in parsed:
+                block = concatenate(blocks)
+                if length(block):
+                    pending.add(loop.run_in_executor(writer, self.write, endpoint, symbol, block))
+                if len(pending) >= self.max_pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    files += [future.result() for future in done]
+            files += await asyncio.gather(*pending)
+        return Manifest(files=files)
@@ -1,4 +1,6 @@
-from typing import Any, Dict, List, Literal, Optional, TypedDict
+from typing import Any, Dict, List, Literal, Optional, Tuple, TypedDict
+
+import numpy as np
 
 
 class ErrorDescription(TypedDict):
@@ -12,3 +14,8 @@ class ApiResponse(TypedDict):
 
 
 Endpoint = Literal["chart", "fundamentals", "options"]
+
+Columns = Dict[str, np.ndarray]
+
+# Data block, keyed by symbol, and the one row block of the symbol meta data
+Tables = Tuple[Columns, Columns]
@@ -60,11 +60,7 @@ def test_get_fundamentals(client_session_mock: MagicMock) -> None:
     end = "2020-12-31"
 
     url = "https://query2.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/timeseries/AAPL"
-    params = {
-        "period1": str_date_to_timestamp(start),
-        "period2": str_date_to_timestamp(end),
-        "type": ",".join(f"annual{option}" for option in fundamentals_type_options),
-    }
+    types = list(dict.fromkeys(f"annual{option}" for option in fundamentals_type_options))
 
     with open("tests/end_to_end/inputs/fundamentals_annual.json", "r") as file:
         mock_chart = json.load(file)
@@ -74,7 +70,16 @@ def test_get_fundamentals(client_session_mock: MagicMock) -> None:
     session = cast(ClientSession, MockSession())
     client_session_mock.return_value = session
 
-    session.add(url, params, "GET", mock_chart)
+    # Types are requested by chunks of 20 by default, each chunk answered with its own results
+    for index in range(0, len(types), 20):
+        chunk = types[index : index + 20]
+        params = {
+            "period1": str_date_to_timestamp(start),
+            "period2": str_date_to_timestamp(end),
+            "type": ",".join(chunk),
+        }
+        results = [result for result in mock_chart["timeseries"]["result"] if result["meta"]["type"][0] in chunk]
+        session.add(url, params, "GET", {"timeseries": {"result": results, "error": None}})
 
     fundamentals_data = get(
         endpoint="fundamentals",
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import json
 from collections import defaultdict, deque
-from typing import Any, DefaultDict, Deque, Dict, Tuple
+from typing import Any, DefaultDict, Deque, Dict, Optional, Tuple
 
 
 class MockResponse:
-    def __init__(self, json: Any) -> None:
+    def __init__(self, json: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
         self._json = json
+        self.status = status
+        self.headers = headers or {}
 
     async def json(self) -> Any:
         return self._json
 
+    async def read(self) -> bytes:
+        return json.dumps(self._json).encode()
+
+    def release(self) -> None:
+        pass
+
 
 class MockSession:
     """Mock aiohttp session providing custom mock responses by URI and resource verb."""
@@ -21,10 +30,18 @@ class MockSession:
         """Set the responses mapping to an empty dict."""
         self._responses = defaultdict(lambda: defaultdict(lambda: defaultdict(deque)))
 
-    def add(self, url: str, params: Dict[str, Any], method: str, response: Any) -> None:
+    def add(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        method: str,
+        response: Any,
+        status: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
         """Add a mock response to a specific URI and resource verb. Responses are queued."""
         hashable_params = self._hashify_params(params)
-        self._responses[url][method][hashable_params].append(MockResponse(response))
+        self._responses[url][method][hashable_params].append(MockResponse(response, status, headers))
 
     async def request(self, method: str, url: str) -> MockResponse:
         """Pop the first response stored for the specified URI and resource verb."""
@@ -42,6 +59,9 @@ class MockSession:
     def _hashify_params(params: Dict[str, Any]) -> Tuple[Tuple[str, str], ...]:
         return tuple(sorted([(key, str(value)) for key, value in params.items()]))
 
+    async def close(self) -> None:
+        pass
+
     async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
         pass
 
@@ -0,0 +1,101 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import cast
+from unittest.mock import patch
+
+import pytest
+from aiohttp import ClientSession
+
+from pyhoo.cache import ResponseCache
+from pyhoo.getter import GetTickerDataTask
+from tests.mock.session import MockSession
+
+with open("tests/unit/responses/options.json", "r") as file:
+    mock_options = json.load(file)
+
+path = "v7/finance/options"
+
+
+def test_response_cache_roundtrip_with_normalized_key(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.db")
+
+    cache.set(path, "NVDA", {"b": 2, "a": 1}, mock_options)
+
+    assert cache.get(path, "NVDA", {"a": 1, "b": 2}) == mock_options
+    assert cache.get(path, "NVDA", {"a": 1}) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["entries"] == 1
+
+
+def test_response_cache_expires_entries_by_endpoint(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.db", ttl={"options": 10})
+    cache.set(path, "NVDA", {}, mock_options)
+
+    with patch("pyhoo.cache.time.time", return_value=cache_time(cache) + 11):
+        assert cache.get(path, "NVDA", {}) is None
+
+
+def test_response_cache_chart_ttl_follows_interval(tmp_path: Path) -> None:
+    """Intraday and past chart responses expire after one bar, unless the chart time to live is given."""
+    chart_path = "v8/finance/chart"
+    cache = ResponseCache(tmp_path / "cache.db")
+    fixed = ResponseCache(tmp_path / "fixed.db", ttl={"chart": 300})
+    past = {"period1": 1594598400, "period2": 1594944000}
+    future = {"period1": 1594598400, "period2": time.time() + 86400}
+
+    assert cache.ttl(chart_path, {"interval": "1m"}) == 60
+    assert cache.ttl(chart_path, {"interval": "1m", **future}) == 60
+    assert cache.ttl(chart_path, {"interval": "1d", **past}) == 86400
+    assert cache.ttl(chart_path, {"interval": "1mo", **past}) == 31 * 86400
+    assert cache.ttl(chart_path, {"interval": "1d", **future}) == 15 * 60
+    assert cache.ttl(chart_path, {"interval": "1d"}) == 15 * 60
+    assert cache.ttl(chart_path, {"range": "1y"}) == 15 * 60
+    assert fixed.ttl(chart_path, {"interval": "1m"}) == fixed.ttl(chart_path, {"interval": "1mo"}) == 300
+    assert cache.ttl(path, {}) == 5 * 60
+
+
+def test_response_cache_counts_lookups_from_threads(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.db")
+    cache.set(path, "NVDA", {}, mock_options)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda ticker: cache.get(path, ticker, {}), ["NVDA", "AAPL"] * 20))
+
+    assert cache.stats()["hits"] == cache.stats()["misses"] == 20
+
+
+def test_response_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path / "cache.db")
+    cache.set(path, "A", {}, mock_options)
+    cache.max_bytes = cache.stats()["bytes"] * 2
+
+    cache.set(path, "B", {}, mock_options)
+    cache.get(path, "A", {})
+    cache.set(path, "C", {}, mock_options)
+
+    assert cache.get(path, "B", {}) is None
+    assert cache.get(path, "A", {}) is not None
+    assert cache.get(path, "C", {}) is not None
+
+
+@pytest.mark.asyncio
+async def test_getter_run_uses_cache(tmp_path: Path) -> None:
+    """The second run is served from the cache, without any request."""
+    cache = ResponseCache(tmp_path / "cache.db")
+    session = MockSession()
+    session.add(f"{GetTickerDataTask._BASE_URL}/{path}/NVDA", {}, "GET", mock_options)
+
+    for _ in range(2):
+        task = GetTickerDataTask(path=path, ticker="NVDA").run(session=cast(ClientSession, session), cache=cache)
+        assert await task == mock_options
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def cache_time(cache: ResponseCache) -> float:
+    with cache._connect() as connection:
+        (accessed_at,) = connection.execute("SELECT MAX(accessed_at) FROM responses").fetchone()
+    return cast(float, accessed_at)
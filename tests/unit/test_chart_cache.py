@@ -0,0 +1,194 @@
+import copy
+import json
+from pathlib import Path
+from typing import Any, Dict, cast
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from aiohttp import ClientSession
+
+from pyhoo.chart_cache import ChartRangeCache, merge_periods, missing_periods
+from pyhoo.client import Client
+from pyhoo.config import str_date_to_timestamp
+from pyhoo.errors import MissingParameterError
+from pyhoo.getter import GetTickerDataTask
+from tests.mock.session import MockSession
+
+with open("tests/unit/responses/chart.json", "r") as file:
+    mock_chart = json.load(file)
+
+
+def _slice_chart(start: int, stop: int) -> Dict[str, Any]:
+    """Mock chart response restricted to the bars `[start:stop]`."""
+    chart = copy.deepcopy(mock_chart)
+    result = chart["chart"]["result"][0]
+    result["timestamp"] = result["timestamp"][start:stop]
+    result["indicators"]["quote"][0] = {
+        field: values[start:stop] for field, values in result["indicators"]["quote"][0].items()
+    }
+    result["indicators"]["adjclose"][0]["adjclose"] = result["indicators"]["adjclose"][0]["adjclose"][start:stop]
+    return cast(Dict[str, Any], chart)
+
+
+def test_merge_periods() -> None:
+    assert merge_periods([(5, 8), (0, 2), (2, 3), (7, 9), (4, 4)]) == [(0, 3), (5, 9)]
+
+
+def test_missing_periods() -> None:
+    assert missing_periods([(2, 4), (6, 8)], 0, 10) == [(0, 2), (4, 6), (8, 10)]
+    assert missing_periods([(0, 10)], 2, 5) == []
+    assert missing_periods([], 2, 5) == [(2, 5)]
+
+
+def test_chart_range_cache_update_and_read(tmp_path: Path) -> None:
+    cache = ChartRangeCache(tmp_path)
+    cache.update("NVDA", "1d", {"timestamp": np.array([1, 2]), "close": np.array([1.0, 2.0])}, [(0, 3)])
+    cache.update("NVDA", "1d", {"timestamp": np.array([2, 3]), "close": np.array([2.5, 3.0])}, [(2, 4)])
+
+    bars = cache.read("NVDA", "1d", 2, 4)
+
+    assert bars["timestamp"].tolist() == [2, 3]
+    assert bars["close"].tolist() == [2.5, 3.0]
+    assert cache.missing("NVDA", "1d", 0, 10) == [(4, 10)]
+    assert cache.missing("AAPL", "1d", 0, 10) == [(0, 10)]
+
+
+def test_chart_range_cache_stores_strings_without_pickle(tmp_path: Path) -> None:
+    """String columns, missing values included, are read back as they were stored, without unpickling."""
+    cache = ChartRangeCache(tmp_path)
+    bars = {"timestamp": np.array([1, 2]), "range": np.array(["1d", None], dtype=object)}
+    cache.update("NVDA", "1d", bars, [(0, 3)])
+
+    with np.load(tmp_path / "1d" / "NVDA.npz", allow_pickle=False) as file:
+        assert all(file[key].dtype != object for key in file.files)
+    stored = cache.read("NVDA", "1d", 0, 3)
+    assert stored["range"].dtype == object
+    assert stored["range"].tolist() == ["1d", None]
+
+
+def test_chart_range_cache_ignores_pickled_files(tmp_path: Path) -> None:
+    """A file holding pickled columns is never unpickled, its bars being fetched again."""
+    (tmp_path / "1d").mkdir()
+    periods = np.array([[0, 3]], dtype=np.int64)
+    np.savez(tmp_path / "1d" / "NVDA.npz", symbol=np.array(["NVDA"], dtype=object), __periods__=periods)
+
+    cache = ChartRangeCache(tmp_path)
+
+    assert cache.missing("NVDA", "1d", 0, 3) == [(0, 3)]
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_only_requests_missing_periods(client_session_mock: MagicMock, tmp_path: Path) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/NVDA"
+    july_13, july_15, july_18 = (str_date_to_timestamp(f"2020-07-{day}") for day in (13, 15, 18))
+    session.add(url, {"period1": july_13, "period2": july_15, "interval": "1d"}, "GET", _slice_chart(0, 2))
+    session.add(url, {"period1": july_15, "period2": july_18, "interval": "1d"}, "GET", _slice_chart(2, 5))
+
+    with Client(chart_cache=ChartRangeCache(tmp_path)) as client:
+        first = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-15")
+        second = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-18")
+
+    assert first["timestamp"].tolist() == mock_chart["chart"]["result"][0]["timestamp"][:2]
+    assert second["timestamp"].tolist() == mock_chart["chart"]["result"][0]["timestamp"]
+    assert second["close"].tolist() == mock_chart["chart"]["result"][0]["indicators"]["quote"][0]["close"]
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_loads_each_cached_ticker_once(client_session_mock: MagicMock, tmp_path: Path) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    july_13, july_18 = str_date_to_timestamp("2020-07-13"), str_date_to_timestamp("2020-07-18")
+    for ticker in ("NVDA", "AAPL"):
+        url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/{ticker}"
+        session.add(url, {"period1": july_13, "period2": july_18, "interval": "1d"}, "GET", mock_chart)
+
+    with patch.object(ChartRangeCache, "load", autospec=True, side_effect=ChartRangeCache.load) as load_mock:
+        with Client(chart_cache=ChartRangeCache(tmp_path)) as client:
+            data = client.get("chart", ["NVDA", "AAPL"], start="2020-07-13", end="2020-07-18")
+
+    assert sorted(call.args[1] for call in load_mock.call_args_list) == ["AAPL", "NVDA"]
+    assert len(data) == 2 * len(mock_chart["chart"]["result"][0]["timestamp"])
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_normalizes_cached_bars(client_session_mock: MagicMock, tmp_path: Path) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/NVDA"
+    july_13, july_18 = str_date_to_timestamp("2020-07-13"), str_date_to_timestamp("2020-07-18")
+    session.add(url, {"period1": july_13, "period2": july_18, "interval": "1d"}, "GET", mock_chart)
+
+    with Client(chart_cache=ChartRangeCache(tmp_path)) as client:
+        result = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-18", normalize=True)
+
+    assert "currency" not in result.data
+    assert result.data["timestamp"].tolist() == mock_chart["chart"]["result"][0]["timestamp"]
+    assert result.meta[["symbol", "currency"]].values.tolist() == [["NVDA", "USD"]]
+
+
+def test_chart_range_cache_last_timestamp(tmp_path: Path) -> None:
+    cache = ChartRangeCache(tmp_path)
+    cache.update("NVDA", "1d", {"timestamp": np.array([3, 1]), "close": np.array([3.0, 1.0])}, [(0, 4)])
+
+    assert cache.last_timestamp("NVDA", "1d") == 3
+    assert cache.last_timestamp("NVDA", "1h") is None
+
+
+@patch("pyhoo.client.time.time")
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_sync_only_requests_bars_since_last_update(
+    client_session_mock: MagicMock, time_mock: MagicMock, tmp_path: Path
+) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/NVDA"
+    timestamps = mock_chart["chart"]["result"][0]["timestamp"]
+    now = timestamps[-1] + 3600
+    time_mock.return_value = now
+    july_13 = str_date_to_timestamp("2020-07-13")
+    session.add(url, {"period1": july_13, "period2": now, "interval": "1d"}, "GET", _slice_chart(0, 3))
+    # The last stored bar is requested again, and must not be duplicated
+    session.add(url, {"period1": timestamps[2], "period2": now, "interval": "1d"}, "GET", _slice_chart(2, 5))
+
+    cache = ChartRangeCache(tmp_path)
+    with Client(chart_cache=cache) as client:
+        first = client.sync("NVDA", start="2020-07-13")
+        second = client.sync("NVDA", start="2020-07-13")
+
+    assert first["timestamp"].tolist() == timestamps[:3]
+    assert second["timestamp"].tolist() == timestamps[2:]
+    assert cache.read("NVDA", "1d", 0, now)["timestamp"].tolist() == timestamps
+
+
+@patch("pyhoo.client.time.time")
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_sync_updates_last_bar(client_session_mock: MagicMock, time_mock: MagicMock, tmp_path: Path) -> None:
+    """The last stored bar may have been still forming, the next sync overwrites it."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/NVDA"
+    timestamps = mock_chart["chart"]["result"][0]["timestamp"]
+    now = timestamps[-1] + 3600
+    time_mock.return_value = now
+    july_13 = str_date_to_timestamp("2020-07-13")
+    forming = _slice_chart(0, 3)
+    forming["chart"]["result"][0]["indicators"]["quote"][0]["close"][2] = -1.0
+    session.add(url, {"period1": july_13, "period2": now, "interval": "1d"}, "GET", forming)
+    session.add(url, {"period1": timestamps[2], "period2": now, "interval": "1d"}, "GET", _slice_chart(2, 5))
+
+    cache = ChartRangeCache(tmp_path)
+    with Client(chart_cache=cache) as client:
+        client.sync("NVDA", start="2020-07-13")
+        client.sync("NVDA", start="2020-07-13")
+
+    closes = mock_chart["chart"]["result"][0]["indicators"]["quote"][0]["close"]
+    assert cache.read("NVDA", "1d", 0, now)["close"].tolist() == closes
+
+
+def test_client_sync_requires_a_chart_cache() -> None:
+    with Client() as client:
+        with pytest.raises(MissingParameterError):
+            client.sync("NVDA", start="2020-07-13")
@@ -0,0 +1,457 @@
+import asyncio
+import copy
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Type,
+    Union,
+    cast,
+)
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from aiohttp import ClientSession
+
+from pyhoo import aget, stream
+from pyhoo.client import AsyncClient, Client
+from pyhoo.config import MAX_CHART_PERIODS, str_date_to_timestamp
+from pyhoo.errors import InvalidParameterValueError
+from pyhoo.getter import GetTickerDataTask
+from tests.mock.session import MockResponse, MockSession
+
+with open("tests/unit/responses/chart.json", "r") as file:
+    mock_chart = json.load(file)
+
+with open("tests/unit/responses/options.json", "r") as file:
+    mock_options = json.load(file)
+
+with open("tests/unit/responses/fundamentals.json", "r") as file:
+    mock_fundamentals = json.load(file)
+
+chart_url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/NVDA"
+chart_params = {
+    "period1": str_date_to_timestamp("2020-07-13"),
+    "period2": str_date_to_timestamp("2020-07-17"),
+    "interval": "1d",
+}
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_reuses_session(client_session_mock: MagicMock) -> None:
+    """Consecutive calls must go through the same session."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    with Client() as client:
+        first = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+        second = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+
+    client_session_mock.assert_called_once()
+    assert first.equals(second)
+    assert len(first) == len(mock_chart["chart"]["result"][0]["timestamp"])
+
+
+@pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_parses_in_executor(
+    client_session_mock: MagicMock, executor_type: Union[Type[ThreadPoolExecutor], Type[ProcessPoolExecutor]]
+) -> None:
+    """Parsing in a pool must give the same frame, the blocks of a process pool being sent back pickled."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    with executor_type(max_workers=1) as executor:
+        with Client(parse_executor=executor) as client:
+            in_executor = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+    with Client() as client:
+        in_loop = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+
+    pd.testing.assert_frame_equal(in_executor, in_loop)
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_warmup(client_session_mock: MagicMock) -> None:
+    """Warming up should fire one request per connection to open."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    for _ in range(3):
+        session.add(GetTickerDataTask._BASE_URL, {}, "HEAD", None)
+
+    client = Client()
+    client.warmup(3)
+    client.close()
+    client.close()
+
+    assert not session._responses[GetTickerDataTask._BASE_URL]["HEAD"][()]
+
+
+@pytest.mark.asyncio
+@patch("pyhoo.client.aiohttp.ClientSession")
+async def test_async_client_shares_session(client_session_mock: MagicMock) -> None:
+    """Concurrent awaits on one client must share its session."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    async with AsyncClient() as client:
+        first, second = await asyncio.gather(
+            client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17"),
+            client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17"),
+        )
+
+    client_session_mock.assert_called_once()
+    assert first.equals(second)
+
+
+@pytest.mark.asyncio
+@patch("pyhoo.client.aiohttp.ClientSession")
+async def test_aget_from_running_loop(client_session_mock: MagicMock) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    chart = await aget("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+
+    assert len(chart) == len(mock_chart["chart"]["result"][0]["timestamp"])
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_stream(client_session_mock: MagicMock) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    frames = dict(stream("chart", ["NVDA"], start="2020-07-13", end="2020-07-17"))
+
+    assert list(frames) == ["NVDA"]
+    assert len(frames["NVDA"]) == len(mock_chart["chart"]["result"][0]["timestamp"])
+
+
+@pytest.mark.parametrize("from_client", [False, True])
+def test_stream_cancels_requests_when_stopped_early(from_client: bool) -> None:
+    """Breaking out of a stream cancels the requests still in flight, none of them being left pending."""
+    cancelled: List[str] = []
+
+    async def run(task: GetTickerDataTask, session: Any, **kwargs: Any) -> Dict[str, Any]:
+        if task._ticker == "FAST":
+            return cast(Dict[str, Any], mock_chart)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(task._ticker)
+            raise
+        return cast(Dict[str, Any], mock_chart)
+
+    tickers = ["FAST", "SLOW1", "SLOW2"]
+    with patch.object(GetTickerDataTask, "run", autospec=True, side_effect=run):
+        if from_client:
+            with Client() as client:
+                with closing(client.stream("chart", tickers, start="2020-07-13", end="2020-07-17")) as frames:
+                    assert next(frames)[0] == "FAST"
+                assert not [task for task in asyncio.all_tasks(client._loop) if not task.done()]
+        else:
+            with closing(stream("chart", tickers, start="2020-07-13", end="2020-07-17")) as frames:
+                assert next(frames)[0] == "FAST"
+
+    assert sorted(cancelled) == ["SLOW1", "SLOW2"]
+
+
+@pytest.mark.parametrize("output", ["numpy", "arrow"])
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_output(client_session_mock: MagicMock, output: Literal["numpy", "arrow"]) -> None:
+    """Every output must hold the same columns and values as the frame."""
+    if output == "arrow":
+        pytest.importorskip("pyarrow")
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    with Client() as client:
+        frame = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+        data = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17", output=output)
+
+    as_frame = pd.DataFrame(data) if output == "numpy" else data.to_pandas()
+    as_frame = as_frame.astype({column: object for column in as_frame.select_dtypes("category")})
+    pd.testing.assert_frame_equal(as_frame, frame, check_dtype=False)
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_typed(client_session_mock: MagicMock) -> None:
+    """The schema dtypes must keep the values of the inferred ones, in less memory."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    with Client() as client:
+        inferred = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+        typed = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17", dtypes="float32")
+
+    assert typed["symbol"].dtype == "category"
+    assert typed["close"].dtype == np.float32
+    assert typed["timestamp"].tolist() == pd.to_datetime(inferred["timestamp"], unit="s").tolist()
+    assert typed.memory_usage(deep=True).sum() < inferred.memory_usage(deep=True).sum()
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_normalized_chart(client_session_mock: MagicMock) -> None:
+    """Joining the bars and the meta table on the symbol must give back the denormalized frame."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    with Client() as client:
+        frame = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17")
+        result = client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17", normalize=True)
+
+    assert list(result.data.columns) == ["symbol", "timestamp", "high", "low", "volume", "open", "close", "adjclose"]
+    assert result.meta["symbol"].tolist() == ["NVDA"]
+    pd.testing.assert_frame_equal(result.data.merge(result.meta, on="symbol")[frame.columns], frame)
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_normalized_options(client_session_mock: MagicMock) -> None:
+    """The quote of the underlying is returned once, in the meta table."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v7/finance/options/NVDA"
+    session.add(url, {}, "GET", mock_options)
+
+    with Client() as client:
+        result = client.get("options", "NVDA", normalize=True)
+
+    quote = mock_options["optionChain"]["result"][0]["quote"]
+    assert len(result.data) == len(mock_options["optionChain"]["result"][0]["options"][0]["calls"]) + len(
+        mock_options["optionChain"]["result"][0]["options"][0]["puts"]
+    )
+    assert result.meta["underlyingSymbol"].tolist() == ["NVDA"]
+    assert result.meta["regularMarketPrice"].tolist() == [quote["regularMarketPrice"]]
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_normalized_options_typed(client_session_mock: MagicMock) -> None:
+    """The epoch fields of the quote become dates, as the ones of the chart meta data."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v7/finance/options/NVDA"
+    session.add(url, {}, "GET", mock_options)
+
+    with Client() as client:
+        result = client.get("options", "NVDA", normalize=True, dtypes="typed")
+
+    quote = mock_options["optionChain"]["result"][0]["quote"]
+    for name in ["regularMarketTime", "earningsTimestamp", "dividendDate"]:
+        assert result.meta[name].tolist() == [pd.Timestamp(int(quote[name]), unit="s")]
+    assert result.data["expiration"].dtype == "datetime64[ns]"
+
+
+def test_get_normalized_fundamentals() -> None:
+    """Fundamentals have no meta data shared by their rows."""
+    with pytest.raises(InvalidParameterValueError):
+        with Client() as client:
+            client.get("fundamentals", "NVDA", type=["annualTotalRevenue"], normalize=True)
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_wide_fundamentals(client_session_mock: MagicMock) -> None:
+    """The wide frame holds one row per symbol and date, and one column per type, as a pivot of the long frame.
+    A ticker requested twice does not duplicate its values.
+    """
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    types = ["annualWorkInProcess", "annualConstructionInProgress"]
+    params = {
+        "period1": str_date_to_timestamp("2017-01-01"),
+        "period2": str_date_to_timestamp("2021-01-01"),
+        "type": ",".join(types),
+    }
+    for ticker, scale in [("NVDA", 1), ("AAPL", 10), ("NVDA", 1)]:
+        response = copy.deepcopy(mock_fundamentals)
+        for result in response["timeseries"]["result"]:
+            result["meta"]["symbol"] = [ticker]
+            for row in result[result["meta"]["type"][0]]:
+                row["reportedValue"]["raw"] *= scale
+        url = f"{GetTickerDataTask._BASE_URL}/ws/fundamentals-timeseries/v1/finance/timeseries/{ticker}"
+        session.add(url, params, "GET", response)
+        session.add(url, params, "GET", response)
+
+    with Client() as client:
+        frame = client.get("fundamentals", ["NVDA", "AAPL"], start="2017-01-01", end="2021-01-01", type=types)
+        wide = client.get(
+            "fundamentals",
+            ["NVDA", "AAPL", "NVDA"],
+            start="2017-01-01",
+            end="2021-01-01",
+            type=types,
+            wide=True,
+            dtypes="float32",
+        )
+
+    pivoted = frame.pivot(index=["symbol", "asOfDate", "periodType"], columns="type", values="reportedValue")
+    assert sorted(wide.columns[3:]) == sorted(types)
+    assert (wide[types].dtypes == np.float32).all()
+    assert len(wide) == len(pivoted) == 4
+    wide = wide.astype({"symbol": object, "periodType": object})
+    wide["asOfDate"] = wide["asOfDate"].dt.strftime("%Y-%m-%d")
+    pd.testing.assert_frame_equal(
+        wide.set_index(["symbol", "asOfDate", "periodType"]), pivoted.astype(np.float32).rename_axis(columns=None)
+    )
+
+
+def test_get_wide_chart() -> None:
+    """Only fundamentals have a wide layout."""
+    with pytest.raises(InvalidParameterValueError):
+        with Client() as client:
+            client.get("chart", "NVDA", start="2020-07-13", end="2020-07-17", wide=True)
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_partial_reports_failed_tickers(client_session_mock: MagicMock) -> None:
+    """A ticker failing must not discard the data of the others."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    session.add(chart_url, chart_params, "GET", mock_chart)
+
+    with patch.object(MockSession, "request", autospec=True, side_effect=_fail_on("FAIL")):
+        with Client() as client:
+            result = client.get("chart", ["NVDA", "FAIL"], start="2020-07-13", end="2020-07-17", partial=True)
+
+    assert len(result.data) == len(mock_chart["chart"]["result"][0]["timestamp"])
+    assert result.failed_tickers == ["FAIL"]
+    assert result.report().to_dict("records") == [{"ticker": "FAIL", "error": "ConnectionResetError", "message": ""}]
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_splits_long_intraday_period(client_session_mock: MagicMock) -> None:
+    """Each window is requested, and the bars returned by several windows are deduplicated."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    start, end = str_date_to_timestamp("2020-07-01"), str_date_to_timestamp("2020-07-11")
+    middle = start + MAX_CHART_PERIODS["1m"]
+    session.add(chart_url, {"period1": start, "period2": middle, "interval": "1m"}, "GET", mock_chart)
+    session.add(chart_url, {"period1": middle, "period2": end, "interval": "1m"}, "GET", mock_chart)
+
+    with Client() as client:
+        data = client.get("chart", "NVDA", start="2020-07-01", end="2020-07-11", granularity="1m")
+
+    assert data["timestamp"].tolist() == mock_chart["chart"]["result"][0]["timestamp"]
+
+
+@pytest.mark.parametrize("granularity", ["1d", "1m"])
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_keeps_tickers_order(client_session_mock: MagicMock, granularity: str) -> None:
+    """Rows come in the order the tickers were requested, whether their period was split or not."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    start, end = str_date_to_timestamp("2020-07-01"), str_date_to_timestamp("2020-07-11")
+    middle = start + MAX_CHART_PERIODS["1m"]
+    windows = [(start, middle), (middle, end)] if granularity == "1m" else [(start, end)]
+    for ticker in ["NVDA", "AAPL"]:
+        response = copy.deepcopy(mock_chart)
+        response["chart"]["result"][0]["meta"]["symbol"] = ticker
+        url = f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/{ticker}"
+        for period1, period2 in windows:
+            session.add(url, {"period1": period1, "period2": period2, "interval": granularity}, "GET", response)
+
+    with Client() as client:
+        data = client.get("chart", ["NVDA", "AAPL"], start="2020-07-01", end="2020-07-11", granularity=granularity)
+
+    timestamps = mock_chart["chart"]["result"][0]["timestamp"]
+    assert data["symbol"].tolist() == ["NVDA"] * len(timestamps) + ["AAPL"] * len(timestamps)
+    assert data["timestamp"].tolist() == timestamps * 2
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_options_of_all_expirations(client_session_mock: MagicMock) -> None:
+    """The expirations listed by the first response are requested in a second round, then combined."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v7/finance/options/NVDA"
+    next_options = copy.deepcopy(mock_options)
+    next_chain = next_options["optionChain"]["result"][0]["options"][0]
+    next_chain["expirationDate"] = 1605225600
+    for contract in next_chain["calls"] + next_chain["puts"]:
+        contract["expiration"] = 1605225600
+    session.add(url, {}, "GET", mock_options)
+    session.add(url, {"date": 1605225600}, "GET", next_options)
+
+    with Client() as client:
+        data = client.get("options", "NVDA", expirations="all")
+
+    assert sorted(data["expiration"].unique().tolist()) == [1604620800, 1605225600]
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_get_options_drops_nearest_expiration_out_of_range(client_session_mock: MagicMock) -> None:
+    """The nearest expiration, returned by the first request, is dropped when before `expirationMin`."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    url = f"{GetTickerDataTask._BASE_URL}/v7/finance/options/NVDA"
+    next_options = copy.deepcopy(mock_options)
+    next_chain = next_options["optionChain"]["result"][0]["options"][0]
+    next_chain["expirationDate"] = 1605225600
+    for contract in next_chain["calls"] + next_chain["puts"]:
+        contract["expiration"] = 1605225600
+    session.add(url, {}, "GET", mock_options)
+    session.add(url, {"date": 1605225600}, "GET", next_options)
+
+    with Client() as client:
+        data = client.get("options", "NVDA", expirations="all", expirationMin="2020-11-10")
+
+    assert data["expiration"].unique().tolist() == [1605225600]
+
+
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_chunks_consume_tickers_lazily(client_session_mock: MagicMock) -> None:
+    """The next chunk of tickers is only pulled once the previous one is yielded."""
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    tickers = ["A", "B", "C"]
+    for ticker in tickers:
+        response = copy.deepcopy(mock_chart)
+        response["chart"]["result"][0]["meta"]["symbol"] = ticker
+        session.add(f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/{ticker}", chart_params, "GET", response)
+    pulled: List[str] = []
+
+    def universe() -> Iterator[str]:
+        for ticker in tickers:
+            pulled.append(ticker)
+            yield ticker
+
+    with Client() as client:
+        chunks = client.chunks("chart", universe(), chunk_size=2, start="2020-07-13", end="2020-07-17")
+        first = next(chunks)
+        assert pulled == ["A", "B"]
+        rest = list(chunks)
+
+    bars = len(mock_chart["chart"]["result"][0]["timestamp"])
+    assert len(first) == 2 * bars
+    assert [len(chunk) for chunk in rest] == [bars]
+
+
+def _fail_on(ticker: str) -> Callable[..., Awaitable[MockResponse]]:
+    request = MockSession.request
+
+    async def side_effect(session: MockSession, method: str, url: str) -> MockResponse:
+        if f"/{ticker}?" in url:
+            raise ConnectionResetError()
+        return await request(session, method, url)
+
+    return side_effect
@@ -0,0 +1,109 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from pyhoo.columns import (
+    Pivot,
+    broadcast,
+    concatenate,
+    deduplicate,
+    from_records,
+    pivot,
+    to_array,
+)
+from pyhoo.parsers import ChartParser
+
+with open("tests/unit/responses/chart.json", "r") as file:
+    mock_chart = json.load(file)
+
+
+def test_to_array_pads_and_coerces_missing_numbers() -> None:
+    """Missing and `None` numbers become `NaN`, like `pandas` does with records."""
+    array = to_array([1, None], 3)
+
+    assert array.dtype == np.float64
+    assert array[0] == 1
+    assert np.isnan(array[1:]).all()
+
+
+def test_to_array_keeps_strings_and_empty_columns_as_objects() -> None:
+    assert to_array(["a", None], 2).dtype == object
+    assert to_array([], 2).tolist() == [None, None]
+
+
+def test_to_array_keeps_numeric_strings_and_booleans_as_objects() -> None:
+    """`astype(float)` converts them, `pandas` keeps them as objects."""
+    assert to_array(["1.5", None], 2).tolist() == ["1.5", None]
+    assert to_array([True, None], 2).tolist() == [True, None]
+    assert to_array([1, 2.5, None], 3).dtype == np.float64
+
+
+def test_broadcast() -> None:
+    assert broadcast(1.5, 3).tolist() == [1.5, 1.5, 1.5]
+    assert broadcast("USD", 2).dtype == object
+    assert broadcast(None, 2).tolist() == [None, None]
+
+
+def test_concatenate_fills_missing_columns() -> None:
+    columns = concatenate([{"a": np.array([1, 2])}, {"a": np.array([3]), "b": np.array([4.0])}, {}])
+
+    assert columns["a"].tolist() == [1, 2, 3]
+    assert np.isnan(columns["b"][:2]).all()
+    assert columns["b"][2] == 4.0
+
+
+def test_deduplicate_keeps_last_occurrence() -> None:
+    block = {"symbol": np.array(["B", "B", "A", "B"], dtype=object), "value": np.array([1, 2, 3, 4])}
+
+    assert deduplicate(block, ["symbol"])["value"].tolist() == [3, 4]
+    assert deduplicate(block, ["symbol"], keep_order=True)["value"].tolist() == [3, 4]
+    block["symbol"][2] = "C"
+    assert deduplicate(block, ["symbol"])["value"].tolist() == [4, 3]
+    assert deduplicate(block, ["symbol"], keep_order=True)["value"].tolist() == [3, 4]
+
+
+def test_pivot_matches_pandas() -> None:
+    block = {
+        "symbol": np.array(["B", "A", "A", "B", "A"], dtype=object),
+        "date": np.array(["2020", "2020", "2021", "2020", "2020"], dtype=object),
+        "type": np.array(["x", "x", "y", "y", "y"], dtype=object),
+        "value": np.array([1.0, 2.0, 3.0, 4.0, np.nan]),
+    }
+    columns = pivot(block, Pivot(keys=["symbol", "date"], names="type", values="value"))
+
+    expected = pd.DataFrame(block).pivot(index=["symbol", "date"], columns="type", values="value")
+    assert list(columns) == ["symbol", "date", "x", "y"]
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(columns).set_index(["symbol", "date"]), expected.rename_axis(columns=None)
+    )
+    assert pivot({}, Pivot(keys=["symbol"], names="type", values="value")) == {}
+
+
+def test_pivot_keeps_last_duplicated_value() -> None:
+    block = {
+        "symbol": np.array(["A", "A", "A"], dtype=object),
+        "type": np.array(["x", "y", "x"], dtype=object),
+        "value": np.array([1.0, 2.0, 3.0]),
+    }
+    columns = pivot(block, Pivot(keys=["symbol"], names="type", values="value"), np.float32)
+
+    assert columns["x"].tolist() == [3.0]
+    assert columns["y"].dtype == np.float32
+
+
+def test_from_records_keeps_key_order() -> None:
+    columns = from_records([{"b": 1, "a": "x"}, {"a": "y", "c": True}])
+
+    assert list(columns) == ["b", "a", "c"]
+    assert columns["a"].tolist() == ["x", "y"]
+
+
+def test_chart_parser_to_columns_matches_records() -> None:
+    """The columnar path must produce the same frame as the records path."""
+    parser = ChartParser(**mock_chart["chart"]["result"][0])
+
+    from_columns = pd.DataFrame(parser.to_columns())
+    from_records = pd.DataFrame(parser.to_records())
+
+    pd.testing.assert_frame_equal(from_columns, from_records)
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from pyhoo.concurrency import AdaptiveConcurrency
+
+
+def test_adaptive_concurrency_increases_additively() -> None:
+    """A full window of successful requests grows the window by one."""
+    concurrency = AdaptiveConcurrency(initial_window=4)
+
+    for _ in range(4):
+        concurrency.record(latency=0.1, failed=False)
+
+    assert concurrency.window == 4
+    concurrency.record(latency=0.1, failed=False)
+    assert concurrency.window == 5
+    assert concurrency.windows() == [4, 5]
+
+
+def test_adaptive_concurrency_decreases_multiplicatively_once_per_latency() -> None:
+    concurrency = AdaptiveConcurrency(initial_window=40, min_window=8)
+
+    concurrency.record(latency=10.0, failed=True)
+    concurrency.record(latency=10.0, failed=True)
+    assert concurrency.window == 20
+
+    concurrency._last_decrease = float("-inf")
+    concurrency.record(latency=10.0, failed=True)
+    concurrency._last_decrease = float("-inf")
+    concurrency.record(latency=10.0, failed=True)
+    assert concurrency.window == 8
+
+
+def test_adaptive_concurrency_decreases_on_slow_requests() -> None:
+    concurrency = AdaptiveConcurrency(initial_window=10, latency_threshold=1.0)
+
+    concurrency.record(latency=2.0, failed=False)
+
+    assert concurrency.window == 5
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_slot_limits_requests_in_flight() -> None:
+    concurrency = AdaptiveConcurrency(initial_window=2, max_window=2)
+    max_in_flight = 0
+
+    async def request() -> None:
+        nonlocal max_in_flight
+        async with concurrency.slot():
+            max_in_flight = max(max_in_flight, concurrency.in_flight)
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert max_in_flight == 2
+    assert concurrency.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_slot_records_failures() -> None:
+    concurrency = AdaptiveConcurrency(initial_window=10)
+
+    with pytest.raises(ConnectionResetError):
+        async with concurrency.slot():
+            raise ConnectionResetError()
+    assert concurrency.window == 5
+
+    await asyncio.sleep(0.01)
+    async with concurrency.slot() as slot:
+        slot.failed = True
+    assert concurrency.window == 2
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from pyhoo.config import (
+    MAX_CHART_PERIODS,
+    Config,
+    endpoints_config,
+    expand_options_expirations,
+    keep_options_expiration,
+    split_chart_period,
+    split_fundamentals_types,
+)
+from pyhoo.errors import InvalidParameterValueError
+from pyhoo.parsers import ChartParser, FundamentalsParser
+
+with open("tests/unit/responses/options.json", "r") as file:
+    mock_options = json.load(file)
+
+
+def test_split_chart_period_in_windows() -> None:
+    week = MAX_CHART_PERIODS["1m"]
+
+    windows = split_chart_period({"period1": 0, "period2": 2 * week + 1, "interval": "1m"})
+
+    assert windows == [
+        {"period1": 0, "period2": week},
+        {"period1": week, "period2": 2 * week},
+        {"period1": 2 * week, "period2": 2 * week + 1},
+    ]
+
+
+def test_split_chart_period_keeps_short_or_daily_periods() -> None:
+    """No split is needed: the requests are sent with the base parameters."""
+    assert split_chart_period({"period1": 0, "period2": 3600, "interval": "1m"}) == [{}]
+    assert split_chart_period({"period1": 0, "period2": 10**9, "interval": "1d"}) == [{}]
+
+
+def test_split_fundamentals_types_in_chunks() -> None:
+    api_params = {"type": "annualA,annualB,annualA,annualC", "types_per_request": 2}
+
+    assert split_fundamentals_types(api_params) == [{"type": "annualA,annualB"}, {"type": "annualC"}]
+
+
+@pytest.mark.parametrize("types_per_request", [0, -1])
+def test_types_per_request_must_be_positive(types_per_request: int) -> None:
+    with pytest.raises(InvalidParameterValueError):
+        endpoints_config["fundamentals"].validate({"types_per_request": types_per_request})
+
+
+def test_local_params_are_not_sent() -> None:
+    fundamentals_config = endpoints_config["fundamentals"]
+    params = {"type": ["annualNetIncome"], "types_per_request": 5}
+    fundamentals_config.validate(params)
+
+    assert fundamentals_config.request_params(fundamentals_config.format(params)) == {"type": "annualNetIncome"}
+
+
+def test_expand_options_expirations() -> None:
+    """The expiration already returned is not requested again."""
+    assert expand_options_expirations({"expirations": "all"}, mock_options) == [{"date": 1605225600}]
+    assert expand_options_expirations({"expirations": "all", "expirationMax": 1605225599}, mock_options) == []
+    assert expand_options_expirations({"expirations": "nearest"}, mock_options) == []
+
+
+def test_keep_options_expiration() -> None:
+    """The nearest expiration is only kept within the requested range."""
+    assert keep_options_expiration({"expirations": "all"}, mock_options)
+    assert keep_options_expiration({"expirations": "all", "expirationMin": 1604620800}, mock_options)
+    assert not keep_options_expiration({"expirations": "all", "expirationMin": 1604620801}, mock_options)
+    assert not keep_options_expiration({"expirations": "all", "expirationMax": 1604620799}, mock_options)
+    assert keep_options_expiration({"expirations": "nearest", "expirationMin": 1604620801}, mock_options)
+
+
+def test_meta_key_requires_parser_tables() -> None:
+    assert Config("v8/finance/chart", "chart", ChartParser, [], meta_key="symbol").meta_key == "symbol"
+    with pytest.raises(TypeError):
+        Config("ws/fundamentals", "timeseries", FundamentalsParser, [], meta_key="symbol")
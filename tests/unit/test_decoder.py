@@ -0,0 +1,29 @@
+import json
+
+import pytest
+
+from pyhoo.decoder import DECODERS, get_decoder
+from pyhoo.errors import InvalidParameterValueError
+
+
+def test_get_decoder_auto_picks_the_fastest_installed() -> None:
+    expected = DECODERS.get("orjson") or DECODERS.get("simdjson") or json.loads
+
+    assert get_decoder("auto") is expected
+
+
+@pytest.mark.parametrize("name", list(DECODERS))
+def test_decoders_read_bytes(name: str) -> None:
+    assert get_decoder(name)(b'{"chart": {"result": [1.5, null]}}') == {"chart": {"result": [1.5, None]}}
+
+
+def test_get_decoder_accepts_a_custom_decoder() -> None:
+    def decoder(data: bytes) -> None:
+        return None
+
+    assert get_decoder(decoder) is decoder
+
+
+def test_get_decoder_raise_unknown_decoder() -> None:
+    with pytest.raises(InvalidParameterValueError):
+        get_decoder("yaml")
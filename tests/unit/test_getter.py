@@ -1,11 +1,15 @@
 import json
 from typing import cast
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from aiohttp import ClientSession
+from aiohttp import ClientConnectionError, ClientSession
 
+from pyhoo.errors import HttpStatusError
 from pyhoo.getter import GetTickerDataTask
 from pyhoo.models.chart import Interval
+from pyhoo.rate_limiter import RateLimiter
+from pyhoo.retry import RetryPolicy
 
 with open("tests/unit/responses/chart.json", "r") as file:
     mock_chart = json.load(file)
@@ -97,3 +101,83 @@ async def test_getter_run_options() -> None:
     options = await task
 
     assert options == mock_options
+
+
+@pytest.mark.asyncio
+async def test_getter_run_retries_throttled_requests() -> None:
+    """429 and 5xx responses are retried, the `Retry-After` header being honored."""
+    ticker = "NVDA"
+    path = "v7/finance/options"
+    session = MockSession()
+    url = f"{GetTickerDataTask._BASE_URL}/{path}/{ticker}"
+
+    session.add(url, {}, "GET", None, status=429, headers={"Retry-After": "0"})
+    session.add(url, {}, "GET", None, status=503)
+    session.add(url, {}, "GET", mock_options)
+
+    task = GetTickerDataTask(path=path, ticker=ticker).run(
+        session=cast(ClientSession, session),
+        retry_policy=RetryPolicy(max_attempts=3, backoff_base=0),
+    )
+
+    assert await task == mock_options
+
+
+@pytest.mark.asyncio
+async def test_getter_run_raises_once_attempts_are_exhausted() -> None:
+    ticker = "NVDA"
+    path = "v7/finance/options"
+    session = MockSession()
+    url = f"{GetTickerDataTask._BASE_URL}/{path}/{ticker}"
+
+    session.add(url, {}, "GET", None, status=503)
+    session.add(url, {}, "GET", None, status=503)
+
+    task = GetTickerDataTask(path=path, ticker=ticker).run(
+        session=cast(ClientSession, session),
+        retry_policy=RetryPolicy(max_attempts=2, backoff_base=0),
+    )
+
+    with pytest.raises(HttpStatusError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_getter_run_retries_exceptions() -> None:
+    ticker = "NVDA"
+    path = "v7/finance/options"
+    session = MockSession()
+    url = f"{GetTickerDataTask._BASE_URL}/{path}/{ticker}"
+
+    session.add(url, {}, "GET", mock_options)
+    request = AsyncMock(side_effect=[ClientConnectionError(), await session.request("GET", url)])
+
+    with patch.object(MockSession, "request", request):
+        task = GetTickerDataTask(path=path, ticker=ticker).run(
+            session=cast(ClientSession, session),
+            retry_policy=RetryPolicy(backoff_base=0),
+        )
+        assert await task == mock_options
+
+    assert request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_getter_run_waits_for_rate_limiter_on_each_attempt() -> None:
+    ticker = "NVDA"
+    path = "v7/finance/options"
+    session = MockSession()
+    url = f"{GetTickerDataTask._BASE_URL}/{path}/{ticker}"
+
+    session.add(url, {}, "GET", None, status=429)
+    session.add(url, {}, "GET", mock_options)
+    rate_limiter = AsyncMock(spec=RateLimiter)
+
+    await GetTickerDataTask(path=path, ticker=ticker).run(
+        session=cast(ClientSession, session),
+        retry_policy=RetryPolicy(backoff_base=0),
+        rate_limiter=rate_limiter,
+    )
+
+    assert rate_limiter.acquire.await_count == 2
+    rate_limiter.acquire.assert_awaited_with("query2.finance.yahoo.com")
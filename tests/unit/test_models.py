@@ -0,0 +1,46 @@
+import pickle
+from dataclasses import FrozenInstanceError, asdict
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pyhoo.models.chart import CurrentTradingPeriod, TradingPeriod
+from pyhoo.models.iterables import Strikes, Timestamp
+from pyhoo.types.chart import TradingPeriodDict
+
+period: TradingPeriodDict = {"timezone": "EDT", "start": 1594627200, "end": 1594647000, "gmtoffset": -14400}
+
+
+def test_slotted_dataclass() -> None:
+    trading_period = TradingPeriod(**period)
+
+    assert not hasattr(trading_period, "__dict__")
+    assert asdict(trading_period) == period
+    assert pickle.loads(pickle.dumps(trading_period)) == trading_period
+    assert TradingPeriod().timezone is None  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        trading_period.start = 0  # type: ignore
+
+
+def test_slotted_model_repr() -> None:
+    current = CurrentTradingPeriod(pre=period, regular=period, post=period)
+
+    assert not hasattr(current, "__dict__")
+    assert repr(current).startswith("CurrentTradingPeriod(pre=TradingPeriod(timezone='EDT'")
+
+
+def test_timestamp() -> None:
+    timestamp = Timestamp([1594647000, 1594733400])
+
+    assert list(timestamp) == [1594647000, 1594733400]
+    assert type(next(iter(timestamp))) is int
+    assert type(timestamp[0]) is int
+    assert timestamp.to_datetime() == [datetime.fromtimestamp(1594647000), datetime.fromtimestamp(1594733400)]
+    assert timestamp.to_str("%Y-%m-%d %H:%M") == [date.strftime("%Y-%m-%d %H:%M") for date in timestamp.to_datetime()]
+    assert timestamp.to_datetime64().tolist() == np.array(["2020-07-13T13:30", "2020-07-14T13:30"], "M8[s]").tolist()
+
+
+def test_empty_iterables_keep_their_dtype() -> None:
+    assert Timestamp([]).values.dtype == np.int64
+    assert Strikes([]).values.dtype == np.float64
@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from pyhoo.errors import InvalidParameterValueError
+from pyhoo.output import to_output
+
+pa = pytest.importorskip("pyarrow")
+
+columns = {
+    "symbol": np.array(["NVDA", "NVDA", "AAPL"], dtype=object),
+    "close": np.array([1.5, np.nan, 3.0]),
+}
+
+
+def test_to_arrow_dictionary_encodes_meta_columns() -> None:
+    table = to_output(columns, "arrow", meta_columns=["symbol"])
+
+    assert pa.types.is_dictionary(table.schema.field("symbol").type)
+    assert table.column("symbol").to_pylist() == ["NVDA", "NVDA", "AAPL"]
+    assert table.column("close").to_pylist() == [1.5, None, 3.0]
+
+
+def test_to_arrow_only_dictionary_encodes_strings() -> None:
+    """Numeric meta columns, e.g. prices, keep their type."""
+    table = to_output(columns, "arrow", meta_columns=["symbol", "close"])
+
+    assert pa.types.is_dictionary(table.schema.field("symbol").type)
+    assert table.schema.field("close").type == pa.float64()
+
+
+def test_to_arrow_uses_large_strings_past_32_bits_offsets() -> None:
+    with patch("pyhoo.output._MAX_STRING_BYTES", 8):
+        table = to_output(columns, "arrow")
+
+    assert table.schema.field("symbol").type == pa.large_string()
+    assert table.column("symbol").to_pylist() == ["NVDA", "NVDA", "AAPL"]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([1, 2, 3]),
+        np.array([1.5, np.nan, 3.0], dtype=np.float32),
+        np.array(["2020-07-13", "NaT", "2020-07-15"], dtype="datetime64[s]"),
+        np.array([True, False, True]),
+        np.array(["NVDA", None, "ÉTÉ"], dtype=object),
+        np.array([True, None, False], dtype=object),
+        np.array(["1d", "5d", "1mo"]),
+        np.array([{"a": 1}, None, {"a": 2}], dtype=object),
+        np.array([None, None], dtype=object),
+        np.array([], dtype=object),
+    ],
+)
+def test_to_arrow_matches_pyarrow(values: np.ndarray) -> None:
+    """Arrays built from the buffers must be the ones `pyarrow.array` would build."""
+    table = to_output({"values": values}, "arrow")
+
+    assert table.column("values").combine_chunks().equals(pa.array(values, from_pandas=True))
+
+
+def test_unknown_output() -> None:
+    with pytest.raises(InvalidParameterValueError):
+        to_output(columns, "polars")  # type: ignore
+
+
+def test_arrow_output_does_not_import_pandas() -> None:
+    code = "\n".join(
+        [
+            "import sys, numpy as np, pyhoo",
+            "from pyhoo.output import to_output",
+            "to_output({'close': np.array([1.0])}, 'arrow')",
+            "assert 'pandas' not in sys.modules, 'pandas imported'",
+        ]
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -39,6 +39,23 @@ def test_param_config_validate_raise_invalid_value() -> None:
         param_config.validate("bad_value")
 
 
+def test_param_config_validate_raise_below_minimum() -> None:
+    """Param value is lower than ParamConfig minimum.
+    It should raise an InvalidParameterValueError.
+    """
+    param_config = ParamConfig(
+        name="name",
+        api_name="api_name",
+        type=int,
+        required=False,
+        minimum=1,
+    )
+
+    param_config.validate(1)
+    with pytest.raises(InvalidParameterValueError):
+        param_config.validate(0)
+
+
 def test_param_config_validate_raise_invalid_prefix() -> None:
     """Param value is prefixed with a prefix not in ParamConfig prefixes.
     It should raise an InvalidParameterPrefixError.
@@ -0,0 +1,78 @@
+import json
+from dataclasses import asdict
+
+import pandas as pd
+
+from pyhoo.columns import from_records
+from pyhoo.parsers import ChartParser, FundamentalsParser, OptionsParser
+
+with open("tests/unit/responses/chart.json", "r") as file:
+    chart_result = json.load(file)["chart"]["result"][0]
+
+with open("tests/unit/responses/options.json", "r") as file:
+    options_result = json.load(file)["optionChain"]["result"][0]
+
+with open("tests/unit/responses/fundamentals.json", "r") as file:
+    fundamentals_result = json.load(file)["timeseries"]["result"][0]
+
+
+def test_chart_columns_do_not_build_models() -> None:
+    """Columns are read from the decoded response, and match the records built from the models."""
+    parser = ChartParser(**chart_result)
+    columns = parser.to_columns()
+
+    assert "meta" not in parser.__dict__ and "indicators" not in parser.__dict__
+    pd.testing.assert_frame_equal(pd.DataFrame(columns), pd.DataFrame(from_records(parser.to_records())))
+
+
+def test_chart_parser_keeps_its_parameters_order() -> None:
+    positional = ChartParser(chart_result["meta"], chart_result["timestamp"], chart_result["indicators"])
+    without_bars = ChartParser(meta=chart_result["meta"], indicators={"quote": [{}], "adjclose": [{}]})
+
+    assert positional.to_columns()["timestamp"].tolist() == chart_result["timestamp"]
+    assert without_bars.to_columns()["timestamp"].tolist() == []
+
+
+def test_chart_meta_builds_trading_periods_on_access() -> None:
+    meta = ChartParser(**chart_result).meta
+
+    assert "currentTradingPeriod" not in meta.__dict__
+    regular = chart_result["meta"]["currentTradingPeriod"]["regular"]
+    assert meta.currentTradingPeriod.regular.timezone == regular["timezone"]
+
+
+def test_options_columns_match_records() -> None:
+    """Contract columns are read from the decoded response, and match the records built from the models."""
+    parser = OptionsParser(**options_result)
+    columns = parser.to_columns()
+
+    assert "options" not in parser.__dict__
+    assert columns["type"].tolist() == ["CALL"] * len(options_result["options"][0]["calls"]) + ["PUT"] * len(
+        options_result["options"][0]["puts"]
+    )
+    pd.testing.assert_frame_equal(pd.DataFrame(columns), pd.DataFrame(from_records(parser.to_records())))
+
+
+def test_options_quote_is_built_on_access() -> None:
+    parser = OptionsParser(**options_result)
+    _, meta = parser.to_tables()
+
+    assert "quote" not in parser.__dict__
+    assert {name: values[0] for name, values in meta.items() if name != "underlyingSymbol"} == asdict(parser.quote)
+
+
+def test_fundamentals_rows_under_type_name() -> None:
+    parser = FundamentalsParser(**fundamentals_result)
+    records = parser.to_records()
+
+    assert "rows" not in parser.__dict__
+    assert [row.reportedValue.raw for row in parser.annualWorkInProcess] == [
+        record["reportedValue"] for record in records
+    ]
+
+
+def test_fundamentals_columns_match_records() -> None:
+    parser = FundamentalsParser(**fundamentals_result)
+
+    assert "rows" not in parser.__dict__
+    pd.testing.assert_frame_equal(pd.DataFrame(parser.to_columns()), pd.DataFrame(from_records(parser.to_records())))
@@ -0,0 +1,74 @@
+import asyncio
+import fcntl
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pyhoo.rate_limiter import FileTokenBucket, TokenBucket
+
+
+def test_token_bucket_allows_bursts_then_waits() -> None:
+    bucket = TokenBucket(rate=2.0, capacity=3.0)
+
+    with patch.object(TokenBucket, "_now", return_value=100.0):
+        waits = [bucket._take("*") for _ in range(4)]
+
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3] == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_over_time() -> None:
+    bucket = TokenBucket(rate=2.0, capacity=1.0)
+
+    with patch.object(TokenBucket, "_now", return_value=100.0):
+        assert bucket._take("*") == 0.0
+        assert bucket._take("*") == pytest.approx(0.5)
+    with patch.object(TokenBucket, "_now", return_value=100.5):
+        assert bucket._take("*") == 0.0
+
+
+def test_token_bucket_is_shared_between_threads() -> None:
+    """Threads taking tokens at the same time never get more than the capacity."""
+    bucket = TokenBucket(rate=1e-9, capacity=1000.0)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        waits = list(executor.map(lambda _: bucket._take("*"), range(4000)))
+
+    assert waits.count(0.0) == 1000
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_per_host() -> None:
+    bucket = TokenBucket(rate=1.0, capacity=1.0, per_host=True)
+
+    with patch.object(TokenBucket, "_now", return_value=100.0):
+        await bucket.acquire("a.com")
+        await bucket.acquire("b.com")
+        assert bucket._take("a.com") > 0
+
+
+def test_file_token_bucket_is_shared_between_instances(tmp_path: Path) -> None:
+    """Two buckets on the same file, as in two processes, share one budget."""
+    first = FileTokenBucket(tmp_path / "bucket", rate=1.0, capacity=2.0)
+    second = FileTokenBucket(tmp_path / "bucket", rate=1.0, capacity=2.0)
+
+    with patch.object(FileTokenBucket, "_now", return_value=100.0):
+        assert first._take("*") == 0.0
+        assert second._take("*") == 0.0
+        assert first._take("*") == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_file_token_bucket_waits_for_lock_outside_event_loop(tmp_path: Path) -> None:
+    """While another process holds the file lock, the other coroutines keep running."""
+    bucket = FileTokenBucket(tmp_path / "bucket", rate=1.0, capacity=1.0)
+
+    with open(tmp_path / "bucket", "a+") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        acquiring = asyncio.ensure_future(bucket.acquire("a.com"))
+        await asyncio.sleep(0.05)
+        assert not acquiring.done()
+        fcntl.flock(file, fcntl.LOCK_UN)
+    await asyncio.wait_for(acquiring, timeout=5)
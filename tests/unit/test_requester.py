@@ -1,4 +1,6 @@
+import asyncio
 import json
+from typing import Any, Dict, List
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -87,3 +89,40 @@ async def test_requester_request_options(mock_getter_run: AsyncMock) -> None:
     options = await requester.request()
 
     assert options == [mock_options]
+
+
+@pytest.mark.asyncio
+async def test_requester_stream_yields_in_completion_order() -> None:
+    """A slow ticker must not hold up the others."""
+    delays = {"SLOW": 0.05, "FAST": 0.0}
+
+    async def run(task: GetTickerDataTask, session: Any, **kwargs: Any) -> Dict[str, Any]:
+        await asyncio.sleep(delays[task._ticker])
+        return {"ticker": task._ticker}
+
+    with patch.object(GetTickerDataTask, "run", autospec=True, side_effect=run):
+        requester = Requester(path="v8/finance/chart", tickers=["SLOW", "FAST"])
+        tickers = [ticker async for ticker, _ in requester.stream()]
+
+    assert tickers == ["FAST", "SLOW"]
+
+
+@pytest.mark.asyncio
+async def test_requester_stream_bounds_tickers_in_flight() -> None:
+    """With a slow consumer, no more tickers than connections are fetched ahead."""
+    started: List[str] = []
+
+    async def run(task: GetTickerDataTask, session: Any, **kwargs: Any) -> Dict[str, Any]:
+        started.append(task._ticker)
+        return {"ticker": task._ticker}
+
+    tickers = [f"T{index}" for index in range(10)]
+    with patch.object(GetTickerDataTask, "run", autospec=True, side_effect=run):
+        requester = Requester(path="v8/finance/chart", tickers=tickers, max_concurrent_calls=3)
+        streamed: List[str] = []
+        async for ticker, _ in requester.stream():
+            await asyncio.sleep(0.01)
+            assert len(started) - len(streamed) <= 3
+            streamed.append(ticker)
+
+    assert sorted(streamed) == sorted(tickers)
@@ -0,0 +1,39 @@
+import datetime
+import email.utils
+
+from pyhoo.retry import RetryPolicy
+
+
+def test_retry_policy_delay_is_capped_exponential_backoff() -> None:
+    policy = RetryPolicy(backoff_base=1.0, backoff_cap=5.0, jitter=False)
+
+    assert [policy.delay(attempt) for attempt in range(1, 6)] == [1.0, 2.0, 4.0, 5.0, 5.0]
+
+
+def test_retry_policy_delay_full_jitter() -> None:
+    policy = RetryPolicy(backoff_base=1.0, backoff_cap=5.0)
+
+    for _ in range(100):
+        assert 0 <= policy.delay(3) <= 4.0
+
+
+def test_retry_policy_delay_honors_retry_after() -> None:
+    policy = RetryPolicy(backoff_cap=10.0)
+
+    assert policy.delay(1, "3") == 3.0
+    assert policy.delay(1, "60") == 10.0
+    in_two_minutes = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(minutes=2)
+    assert policy.delay(1, email.utils.format_datetime(in_two_minutes)) == 10.0
+
+
+def test_retry_policy_delay_ignores_retry_after_if_disabled() -> None:
+    policy = RetryPolicy(backoff_base=1.0, jitter=False, respect_retry_after=False)
+
+    assert policy.delay(1, "3") == 1.0
+
+
+def test_retry_policy_can_retry() -> None:
+    policy = RetryPolicy(max_attempts=2)
+
+    assert policy.can_retry(1)
+    assert not policy.can_retry(2)
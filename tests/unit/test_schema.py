@@ -0,0 +1,69 @@
+from typing import Optional, TypedDict
+
+import numpy as np
+import pytest
+
+from pyhoo.errors import InvalidParameterValueError
+from pyhoo.schema import Schema
+
+
+class RecordDict(TypedDict):
+
+    symbol: str
+    date: str
+    time: int
+    volume: int
+    close: float
+    price: Optional[float]
+    scale: Optional[int]
+
+
+schema = Schema.from_types(
+    RecordDict, categories=["symbol", "scale"], timestamps=["time"], dates=["date"]
+).for_dtypes("typed")
+
+
+def test_schema_from_types() -> None:
+    assert schema is not None
+    assert schema.types["price"] is float
+    assert schema.types["scale"] is int
+    assert schema.categories == ["symbol"]
+
+
+def test_schema_apply() -> None:
+    assert schema is not None
+    typed = schema.apply(
+        {
+            "symbol": np.array(["NVDA", "NVDA"], dtype=object),
+            "date": np.array(["2020-09-30", None], dtype=object),
+            "time": np.array([1594647000.0, np.nan]),
+            "volume": np.array([1.0, 2.0]),
+            "close": np.array([1, 2]),
+            "scale": np.array([3.0, np.nan]),
+            "other": np.array([1.0, 2.0]),
+            "price": np.array([None, None], dtype=object),
+        }
+    )
+
+    assert typed["symbol"].dtype == object
+    assert typed["date"].tolist() == [np.datetime64("2020-09-30T00:00:00"), None]
+    assert typed["time"].dtype == np.dtype("datetime64[s]")
+    assert np.isnat(typed["time"][1])
+    assert typed["volume"].dtype == np.int64
+    assert typed["close"].dtype == np.float64
+    assert typed["scale"].dtype == np.float64
+    assert typed["other"].dtype == np.float64
+    assert typed["price"].dtype == np.float64
+    assert np.isnan(typed["price"]).all()
+
+
+def test_schema_float32() -> None:
+    float32 = Schema.from_types(RecordDict).for_dtypes("float32")
+    assert float32 is not None
+    assert float32.apply({"close": np.array([1.5])})["close"].dtype == np.float32
+
+
+def test_schema_for_dtypes() -> None:
+    assert Schema().for_dtypes("inferred") is None
+    with pytest.raises(InvalidParameterValueError):
+        Schema().for_dtypes("int8")  # type: ignore
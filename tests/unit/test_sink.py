@@ -0,0 +1,73 @@
+import asyncio
+import copy
+import json
+from pathlib import Path
+from typing import AsyncIterator, List, Tuple, cast
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from aiohttp import ClientSession
+
+from pyhoo.client import Client
+from pyhoo.config import str_date_to_timestamp
+from pyhoo.errors import InvalidParameterValueError
+from pyhoo.getter import GetTickerDataTask
+from pyhoo.sink import DatasetSink
+from pyhoo.types import Columns
+from tests.mock.session import MockSession
+
+dataset = pytest.importorskip("pyarrow.dataset")
+
+with open("tests/unit/responses/chart.json", "r") as file:
+    mock_chart = json.load(file)
+
+chart_params = {
+    "period1": str_date_to_timestamp("2020-07-13"),
+    "period2": str_date_to_timestamp("2020-07-17"),
+    "interval": "1d",
+}
+
+
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+@patch("pyhoo.client.aiohttp.ClientSession")
+def test_client_sink_writes_partitioned_dataset(client_session_mock: MagicMock, format: str, tmp_path: Path) -> None:
+    session = MockSession()
+    client_session_mock.return_value = cast(ClientSession, session)
+    for ticker in ("NVDA", "AAPL"):
+        response = copy.deepcopy(mock_chart)
+        response["chart"]["result"][0]["meta"]["symbol"] = ticker
+        session.add(f"{GetTickerDataTask._BASE_URL}/v8/finance/chart/{ticker}", chart_params, "GET", response)
+
+    with Client() as client:
+        manifest = client.sink(
+            "chart",
+            ["NVDA", "AAPL"],
+            DatasetSink(tmp_path, format=format),  # type: ignore
+            start="2020-07-13",
+            end="2020-07-17",
+        )
+
+    bars = len(mock_chart["chart"]["result"][0]["timestamp"])
+    assert sorted(file.symbol for file in manifest.files) == ["AAPL", "NVDA"]
+    assert manifest.rows == 2 * bars
+    assert all(path.parent.parent.name == "endpoint=chart" for path in manifest.paths)
+    table = dataset.dataset(tmp_path / "endpoint=chart", format=format, partitioning="hive").to_table()
+    assert table.num_rows == 2 * bars
+
+
+def test_dataset_sink_writes_one_file_per_response(tmp_path: Path) -> None:
+    async def parsed() -> AsyncIterator[Tuple[str, List[Columns]]]:
+        yield "AAPL", [{"close": np.arange(3.0)}, {"close": np.arange(2.0)}, {}]
+        yield "NVDA", [{"close": np.arange(4.0)}]
+        yield "MSFT", []
+
+    manifest = asyncio.run(DatasetSink(tmp_path).write_all("chart", parsed()))
+
+    assert sorted((file.symbol, file.rows) for file in manifest.files) == [("AAPL", 5), ("NVDA", 4)]
+    assert len(list(tmp_path.glob("endpoint=chart/symbol=AAPL/*.parquet"))) == 1
+
+
+def test_dataset_sink_raise_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(InvalidParameterValueError):
+        DatasetSink(tmp_path, format="csv")  # type: ignore